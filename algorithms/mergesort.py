@@ -17,13 +17,25 @@ def merge(l1: list[T], l2: list[T], key=lambda x:x) -> list[T]:
     new_list = []
     cur_left = 0
     cur_right = 0
-    while cur_left < len(l1) and cur_right < len(l2):
-        if key(l1[cur_left]) <= key(l2[cur_right]):
-            new_list.append(l1[cur_left])
-            cur_left += 1
-        else:
-            new_list.append(l2[cur_right])
-            cur_right += 1
+    len_left = len(l1)
+    len_right = len(l2)
+    if len_left > 0 and len_right > 0:
+        # Each key is computed once, when its element reaches the front of its list.
+        key_left = key(l1[0])
+        key_right = key(l2[0])
+        while True:
+            if key_left <= key_right:
+                new_list.append(l1[cur_left])
+                cur_left += 1
+                if cur_left == len_left:
+                    break
+                key_left = key(l1[cur_left])
+            else:
+                new_list.append(l2[cur_right])
+                cur_right += 1
+                if cur_right == len_right:
+                    break
+                key_right = key(l2[cur_right])
     new_list += l1[cur_left:]
     new_list += l2[cur_right:]
     return new_list
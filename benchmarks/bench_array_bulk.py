@@ -0,0 +1,55 @@
+"""
+Benchmark of the bulk operations of ArrayR against the element by element loops
+they replace in the rebuild and resize paths: filling a heap array from a list of
+points (MaxHeap.heapify), growing an array (MaxHeap._resize) and copying the
+elements of a set into a new one (ASet.union).
+
+Run from the repository root with:
+    python -m benchmarks.bench_array_bulk
+"""
+from __future__ import annotations
+import time
+from data_structures.referential_array import ArrayR
+
+N = 10**6
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def fill_loop(points: list[int]) -> None:
+    array = ArrayR(2 * len(points) + 2)
+    for i in range(len(points)):
+        array[i+1] = points[i]
+
+
+def fill_slice(points: list[int]) -> None:
+    array = ArrayR(2 * len(points) + 2)
+    array.set_slice(1, points)
+
+
+def copy_loop(array: ArrayR[int]) -> None:
+    target = ArrayR(2 * len(array))
+    for i in range(len(array)):
+        target[i] = array[i]
+
+
+def copy_bulk(array: ArrayR[int]) -> None:
+    array.copy_into(ArrayR(2 * len(array)))
+
+
+if __name__ == "__main__":
+    points = list(range(N))
+    array = ArrayR.from_iterable(points)
+    cases = [
+        ("heapify fill", lambda: fill_loop(points), lambda: fill_slice(points)),
+        ("resize x2", lambda: copy_loop(array), lambda: array.resize(2 * len(array))),
+        ("union copy", lambda: copy_loop(array), lambda: copy_bulk(array)),
+    ]
+    print("{0:>14}{1:>10}{2:>10}{3:>10}".format(str(N) + " items", "loop s", "bulk s", "speedup"))
+    for label, loop, bulk in cases:
+        before, after = timed(loop), timed(bulk)
+        print("{0:>14}{1:>10.3f}{2:>10.3f}{3:>9.1f}x".format(label, before, after, before / after))
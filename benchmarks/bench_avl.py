@@ -0,0 +1,68 @@
+"""
+Benchmark of BinarySearchTree against AVLTree on sorted, reverse-sorted and random keys.
+Sorted and reverse-sorted keys make the plain BinarySearchTree a linked list, which takes
+quadratic time to build, so it is only run on them up to SKEWED_BST_MAX_SIZE keys.
+
+Run from the repository root with:
+    python -m benchmarks.bench_avl
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+from data_structures.bst import BinarySearchTree
+from data_structures.avl import AVLTree
+
+SIZES = [500, 900, 10**4, 10**5]
+# largest number of sorted or reverse-sorted keys inserted in a plain BinarySearchTree
+SKEWED_BST_MAX_SIZE = 10**4
+
+
+def tree_depth(tree: BinarySearchTree) -> int:
+    """ Depth of the tree, computed without recursion so that skewed trees can be measured. """
+    depth = 0
+    stack = [(tree.root, 1)] if tree.root is not None else []
+    while stack:
+        current, level = stack.pop()
+        depth = max(depth, level)
+        if current.left is not None:
+            stack.append((current.left, level + 1))
+        if current.right is not None:
+            stack.append((current.right, level + 1))
+    return depth
+
+
+def make_keys(order: str, n: int) -> list[int]:
+    keys = list(range(n))
+    if order == "reverse":
+        keys.reverse()
+    elif order == "random":
+        RandomGen.set_seed(n)
+        RandomGen.random_shuffle(keys)
+    return keys
+
+
+def run(tree_cls: type, keys: list[int]) -> str:
+    tree = tree_cls()
+    try:
+        start = time.perf_counter()
+        for key in keys:
+            tree[key] = key
+        built = time.perf_counter()
+        for key in keys:
+            _ = tree[key]
+        looked_up = time.perf_counter()
+    except RecursionError:
+        return "{0:>48}".format("RecursionError")
+    return "{0:>10.3f}s insert {1:>10.3f}s lookup depth {2:>6}".format(
+        built - start, looked_up - built, tree_depth(tree))
+
+
+if __name__ == "__main__":
+    for n in SIZES:
+        for order in ["sorted", "reverse", "random"]:
+            keys = make_keys(order, n)
+            for tree_cls in [BinarySearchTree, AVLTree]:
+                if tree_cls is BinarySearchTree and order != "random" and n > SKEWED_BST_MAX_SIZE:
+                    print("{0:>7} {1:<8} {2:<17}{3:>48}".format(n, order, tree_cls.__name__, "skipped"))
+                    continue
+                print("{0:>7} {1:<8} {2:<17}{3}".format(n, order, tree_cls.__name__, run(tree_cls, keys)))
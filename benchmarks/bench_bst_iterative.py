@@ -0,0 +1,98 @@
+"""
+Per-operation benchmark of the loop-based BinarySearchTree operations against
+the previous recursive implementations, on trees of 10^5 random keys.
+
+Run from the repository root with:
+    python -m benchmarks.bench_bst_iterative
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+from data_structures.bst import BinarySearchTree
+from data_structures.node import TreeNode
+
+N = 10**5
+
+
+class RecursiveBinarySearchTree(BinarySearchTree):
+    """ BinarySearchTree with the recursive lookup, insert and delete it used to have. """
+
+    def get_tree_node_by_key_aux(self, current: TreeNode, key) -> TreeNode:
+        if current is None:
+            raise KeyError('Key not found: {0}'.format(key))
+        elif key == current.key:
+            return current
+        elif key < current.key:
+            return self.get_tree_node_by_key_aux(current.left, key)
+        else:
+            return self.get_tree_node_by_key_aux(current.right, key)
+
+    def insert_aux(self, current: TreeNode, key, item) -> TreeNode:
+        if current is None:
+            current = TreeNode(key, item)
+            self.length += 1
+        elif key < current.key:
+            current.left = self.insert_aux(current.left, key, item)
+        elif key > current.key:
+            current.right = self.insert_aux(current.right, key, item)
+        else:
+            raise ValueError('Inserting duplicate item')
+        return current
+
+    def delete_aux(self, current: TreeNode, key) -> TreeNode:
+        if current is None:
+            raise ValueError('Deleting non-existent item')
+        elif key < current.key:
+            current.left = self.delete_aux(current.left, key)
+        elif key > current.key:
+            current.right = self.delete_aux(current.right, key)
+        else:
+            if self.is_leaf(current):
+                self.length -= 1
+                return None
+            elif current.left is None:
+                self.length -= 1
+                return current.right
+            elif current.right is None:
+                self.length -= 1
+                return current.left
+            succ = self.get_successor(current)
+            current.key = succ.key
+            current.item = succ.item
+            current.right = self.delete_aux(current.right, succ.key)
+        return current
+
+    def get_minimal(self, current: TreeNode) -> TreeNode:
+        if current is None:
+            return None
+        if current.left is None:
+            return current
+        return self.get_minimal(current.left)
+
+
+def time_operations(tree_cls: type, keys: list[int]) -> tuple[float, float, float]:
+    """ Returns the average insert, lookup and delete time per operation in microseconds. """
+    tree = tree_cls()
+    start = time.perf_counter()
+    for key in keys:
+        tree[key] = key
+    inserted = time.perf_counter()
+    for key in keys:
+        _ = tree[key]
+    looked_up = time.perf_counter()
+    for key in keys:
+        del tree[key]
+    deleted = time.perf_counter()
+    per_op = 10**6 / len(keys)
+    return (inserted - start) * per_op, (looked_up - inserted) * per_op, (deleted - looked_up) * per_op
+
+
+if __name__ == "__main__":
+    RandomGen.set_seed(N)
+    keys = list(range(N))
+    RandomGen.random_shuffle(keys)
+    recursive = time_operations(RecursiveBinarySearchTree, keys)
+    iterative = time_operations(BinarySearchTree, keys)
+    print("{0:<8}{1:>14}{2:>14}{3:>10}".format("op", "recursive us", "iterative us", "speedup"))
+    for name, old, new in zip(["insert", "lookup", "delete"], recursive, iterative):
+        print("{0:<8}{1:>14.2f}{2:>14.2f}{3:>9.2f}x".format(name, old, new, old / new))
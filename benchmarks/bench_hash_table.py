@@ -0,0 +1,72 @@
+"""
+Benchmark of the hash tables on insert and delete heavy mixes: LinearProbeTable
+against CachedHashTable with plain linear probing and with Robin Hood probing.
+
+Every table is filled with N island names (going through all its resizes), then
+takes N mixed operations, each deleting a random key that is in the table or
+inserting a new one, and finally looks up every key that is left. The probe
+lengths are those of the keys left at the end.
+
+Run from the repository root with:
+    python -m benchmarks.bench_hash_table
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+from data_structures.hash_table import LinearProbeTable, CachedHashTable
+
+N = 10**6
+TABLES = [
+    ("linear probe", lambda: LinearProbeTable()),
+    ("cached", lambda: CachedHashTable(robin_hood=False)),
+    ("robin hood", lambda: CachedHashTable()),
+]
+
+
+def make_mix(n: int) -> list[tuple[bool, str]]:
+    """ N operations, half deletions of a key in the table and half insertions of a new key. """
+    RandomGen.set_seed(n)
+    present = ["Island " + str(i) for i in range(n)]
+    operations = []
+    for i in range(n):
+        if RandomGen.randint(0, 1) == 0:
+            position = RandomGen.randint(0, len(present) - 1)
+            present[position], present[-1] = present[-1], present[position]
+            operations.append((False, present.pop()))
+        else:
+            present.append("Island " + str(n + i))
+            operations.append((True, present[-1]))
+    return operations
+
+
+if __name__ == "__main__":
+    names = ["Island " + str(i) for i in range(N)]
+    operations = make_mix(N)
+    print("{0:>14}{1:>10}{2:>10}{3:>10}{4:>12}{5:>12}".format(
+        "table", "fill s", "mix s", "get s", "mean probe", "max probe"))
+    for label, make_table in TABLES:
+        table = make_table()
+        start = time.perf_counter()
+        for name in names:
+            table[name] = name
+        fill = time.perf_counter() - start
+        start = time.perf_counter()
+        for insert, name in operations:
+            if insert:
+                table[name] = name
+            else:
+                del table[name]
+        mix = time.perf_counter() - start
+        keys = table.keys()
+        start = time.perf_counter()
+        for key in keys:
+            table[key]
+        get = time.perf_counter() - start
+        if isinstance(table, CachedHashTable):
+            probes = table.probe_lengths()
+        else:
+            size = table.table_size
+            probes = [(position - table.hash(item[0])) % size
+                      for position, item in enumerate(table.array) if item is not None]
+        print("{0:>14}{1:>10.2f}{2:>10.2f}{3:>10.2f}{4:>12.2f}{5:>12}".format(
+            label, fill, mix, get, sum(probes) / len(probes), max(probes)))
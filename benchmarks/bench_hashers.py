@@ -0,0 +1,40 @@
+"""
+Benchmark of the hashers of the hash tables: lookup throughput of LinearProbeTable
+with polynomial_hash (with and without the memo) and builtin_hash, and of
+CachedHashTable with builtin_hash, on N island names.
+
+Each table is filled with the names, then every name is looked up twice in a row.
+The memo holds every name in the table from its insertion on, so no lookup hashes.
+
+Run from the repository root with:
+    python -m benchmarks.bench_hashers
+"""
+from __future__ import annotations
+import time
+from data_structures.hash_table import LinearProbeTable, CachedHashTable, polynomial_hash
+
+N = 10**6
+TABLES = [
+    ("polynomial", lambda: LinearProbeTable(hasher=polynomial_hash)),
+    ("polynomial+memo", lambda: LinearProbeTable(hasher=polynomial_hash, memo=True)),
+    ("builtin", lambda: LinearProbeTable()),
+    ("cached builtin", lambda: CachedHashTable()),
+]
+
+
+if __name__ == "__main__":
+    names = ["Island of the Crimson Tide no. " + str(i) for i in range(N)]
+    print("{0:>16}{1:>10}{2:>16}{3:>16}".format("hasher", "fill s", "1st lookups/s", "2nd lookups/s"))
+    for label, make_table in TABLES:
+        table = make_table()
+        start = time.perf_counter()
+        for name in names:
+            table[name] = name
+        fill = time.perf_counter() - start
+        rates = []
+        for _ in range(2):
+            start = time.perf_counter()
+            for name in names:
+                table[name]
+            rates.append(N / (time.perf_counter() - start))
+        print("{0:>16}{1:>10.2f}{2:>16,.0f}{3:>16,.0f}".format(label, fill, rates[0], rates[1]))
@@ -0,0 +1,65 @@
+"""
+Benchmark of the arity of the heaps: rise (add) and sink (get_max) on DaryMaxHeaps of
+HeapKeys with d = 2, 4 and 8 against the binary MaxHeap, and end-to-end
+Mode2Navigator.simulate_day with keep_index and every HEAP_ARITY.
+
+Run from the repository root with:
+    python -m benchmarks.bench_heap_arity
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+from data_structures.heap import MaxHeap, DaryMaxHeap
+from mode2 import Mode2Navigator, HeapKey
+from benchmarks.bench_mode2_days import make_islands
+
+HEAP_SIZE = 10**5
+ARITIES = [2, 4, 8]
+N_ISLANDS = [10**5, 10**6]
+N_PIRATES = 1000
+CREWS = [100, 100, 120]
+
+
+def make_keys(n: int) -> list[HeapKey]:
+    RandomGen.set_seed(n)
+    return [HeapKey(str(i), RandomGen.random() % 100000) for i in range(n)]
+
+
+def time_heap(make_heap, keys: list[HeapKey]) -> tuple[float, float]:
+    heap = make_heap()
+    start = time.perf_counter()
+    for key in keys:
+        heap.add(key)
+    rise = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(len(keys)):
+        heap.get_max()
+    sink = time.perf_counter() - start
+    return rise, sink
+
+
+if __name__ == "__main__":
+    keys = make_keys(HEAP_SIZE)
+    print("{0:>10}{1:>10}{2:>12}".format("heap", "add s", "get_max s"))
+    rise, sink = time_heap(lambda: MaxHeap(HEAP_SIZE), keys)
+    print("{0:>10}{1:>10.3f}{2:>12.3f}".format("binary", rise, sink))
+    for arity in ARITIES:
+        rise, sink = time_heap(lambda: DaryMaxHeap(HEAP_SIZE, arity), keys)
+        print("{0:>10}{1:>10.3f}{2:>12.3f}".format("d=" + str(arity), rise, sink))
+
+    print()
+    print("{0:>8}{1:>8}{2:>12}{3:>12}".format("islands", "arity", "first day s", "next days s"))
+    for n in N_ISLANDS:
+        islands = make_islands(n)
+        for arity in ARITIES:
+            nav = Mode2Navigator(N_PIRATES, keep_index=True)
+            nav.HEAP_ARITY = arity
+            nav.add_islands(islands)
+            start = time.perf_counter()
+            nav.simulate_day(CREWS[0])
+            first = time.perf_counter() - start
+            start = time.perf_counter()
+            for crew in CREWS[1:]:
+                nav.simulate_day(crew)
+            rest = time.perf_counter() - start
+            print("{0:>8}{1:>8}{2:>12.3f}{3:>12.3f}".format(n, arity, first, rest))
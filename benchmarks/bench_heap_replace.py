@@ -0,0 +1,82 @@
+"""
+Benchmark of changing the top of a MaxHeap: get_max followed by add against a
+single replace_top, on heaps of HeapKeys as used by Mode2Navigator.
+
+Both report the number of key comparisons per operation, which is the sift work,
+next to the time, which also includes the loop and the HeapKey allocations.
+replace_top does one sink where get_max+add does a sink and a rise, so what it
+saves depends on where the new key ends up:
+- same: the new key is still the top. replace_top stops after the two children,
+  get_max+add sinks the last leaf and rises the new key through the whole heap.
+- random: the new key lands anywhere.
+- lower: the new key is half of the top, like an island in Mode2Navigator.plunder,
+  whose key only goes back in once its score is below the runner-up. Both sink it
+  deep and the rise of add stops almost at once, so they do about the same work.
+
+Run from the repository root with:
+    python -m benchmarks.bench_heap_replace
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+from data_structures.heap import MaxHeap
+from mode2 import HeapKey
+
+SIZES = [10**3, 10**5]
+N_OPS = 10**5
+NEW_SCORES = {
+    "same": lambda score: score,
+    "random": lambda score: RandomGen.random() % 100000,
+    "lower": lambda score: score * 0.5,
+}
+
+
+class CountedKey(HeapKey):
+    """ HeapKey counting its comparisons, every comparison of HeapKey goes through __gt__. """
+    comparisons = 0
+
+    def __gt__(a: HeapKey, b: HeapKey):
+        CountedKey.comparisons += 1
+        return HeapKey.__gt__(a, b)
+
+
+def make_heap(n: int, key_cls: type[HeapKey]) -> MaxHeap[HeapKey]:
+    RandomGen.set_seed(n)
+    return MaxHeap.heapify([key_cls(str(i), RandomGen.random() % 100000) for i in range(n)])
+
+
+def pop_add(heap: MaxHeap[HeapKey], key_cls: type[HeapKey], new_score) -> None:
+    for _ in range(N_OPS):
+        top = heap.get_max()
+        heap.add(key_cls(top.name, new_score(top.score)))
+
+
+def replace(heap: MaxHeap[HeapKey], key_cls: type[HeapKey], new_score) -> None:
+    for _ in range(N_OPS):
+        top = heap.peek()
+        heap.replace_top(key_cls(top.name, new_score(top.score)))
+
+
+def comparisons(run, n: int, new_score) -> float:
+    heap = make_heap(n, CountedKey)
+    CountedKey.comparisons = 0
+    run(heap, CountedKey, new_score)
+    return CountedKey.comparisons / N_OPS
+
+
+def seconds(run, n: int, new_score) -> float:
+    heap = make_heap(n, HeapKey)
+    start = time.perf_counter()
+    run(heap, HeapKey, new_score)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print("{0:>8}{1:>8}{2:>12}{3:>12}{4:>12}{5:>12}{6:>10}".format(
+        "size", "score", "pop+add cmp", "replace cmp", "pop+add s", "replace s", "speedup"))
+    for n in SIZES:
+        for name, new_score in NEW_SCORES.items():
+            times = [seconds(pop_add, n, new_score), seconds(replace, n, new_score)]
+            print("{0:>8}{1:>8}{2:>12.1f}{3:>12.1f}{4:>12.3f}{5:>12.3f}{6:>9.2f}x".format(
+                n, name, comparisons(pop_add, n, new_score), comparisons(replace, n, new_score),
+                times[0], times[1], times[0] / times[1]))
@@ -0,0 +1,75 @@
+"""
+Benchmark of an IslandTable on its own, against a list of Island instances: the
+memory used to hold the islands, measured with tracemalloc, and the time to
+compute the marine-money ratio of every island, one island at a time for the
+list and column-wise with NumPy (when installed) for the table.
+
+The navigators take the islands of a table as Island instances (see
+IslandTable.to_islands), so the table does not change their memory use.
+
+Run from the repository root with:
+    python -m benchmarks.bench_island_table
+"""
+from __future__ import annotations
+import time
+import tracemalloc
+from random_gen import RandomGen
+from island import Island
+from island_table import IslandTable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SIZES = [10**5, 10**6]
+
+
+def make_columns(n: int) -> list[tuple[str, float, int]]:
+    RandomGen.set_seed(n)
+    return [(str(i), RandomGen.random() % 50000 + 0.5, RandomGen.randint(1, 300)) for i in range(n)]
+
+
+def traced(build, *args):
+    tracemalloc.start()
+    built = build(*args)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, current
+
+
+def build_list(columns):
+    return [Island(name, money, marines) for name, money, marines in columns]
+
+
+def build_table(columns):
+    table = IslandTable()
+    for name, money, marines in columns:
+        table.append(name, money, marines)
+    return table
+
+
+def list_ratios(islands: list[Island]) -> list[float]:
+    return [island.marines / island.money for island in islands]
+
+
+def table_ratios(table: IslandTable):
+    if np is None:
+        return [marines / money for money, marines in zip(table.money, table.marines)]
+    return np.frombuffer(table.marines, dtype=np.int64) / np.frombuffer(table.money, dtype=np.float64)
+
+
+if __name__ == "__main__":
+    print("{0:>8}{1:>14}{2:>14}{3:>16}{4:>16}".format("islands", "list B/isl", "table B/isl", "list ratios s", "table ratios s"))
+    for n in SIZES:
+        columns = make_columns(n)
+        islands, list_bytes = traced(build_list, columns)
+        table, table_bytes = traced(build_table, columns)
+        start = time.perf_counter()
+        list_ratios(islands)
+        list_time = time.perf_counter() - start
+        start = time.perf_counter()
+        table_ratios(table)
+        table_time = time.perf_counter() - start
+        print("{0:>8}{1:>14.1f}{2:>14.1f}{3:>16.3f}{4:>16.3f}".format(
+            n, list_bytes / n, table_bytes / n, list_time, table_time))
@@ -0,0 +1,39 @@
+"""
+Benchmark of Mode1Navigator construction: inserting the islands one at a time
+against bulk-loading the tree with AVLTree.from_items.
+
+Run from the repository root with:
+    python -m benchmarks.bench_mode1_build
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+from island import Island
+from data_structures.avl import AVLTree
+from mode1 import Mode1Navigator
+
+SIZES = [10**4, 10**5, 10**6]
+
+
+def make_islands(n: int) -> list[Island]:
+    RandomGen.set_seed(n)
+    return [Island(str(i), RandomGen.random() % 50000 + 1 + i / n, RandomGen.randint(1, 300)) for i in range(n)]
+
+
+def insert_one_by_one(islands: list[Island]) -> AVLTree:
+    tree = AVLTree()
+    for island in islands:
+        tree[island.marines/island.money] = island
+    return tree
+
+
+if __name__ == "__main__":
+    print("{0:>8}{1:>16}{2:>16}{3:>10}".format("islands", "one by one s", "from_items s", "speedup"))
+    for n in SIZES:
+        islands = make_islands(n)
+        start = time.perf_counter()
+        insert_one_by_one(islands)
+        inserted = time.perf_counter()
+        Mode1Navigator(islands, 100)
+        loaded = time.perf_counter()
+        print("{0:>8}{1:>16.3f}{2:>16.3f}{3:>9.2f}x".format(n, inserted - start, loaded - inserted, (inserted - start) / (loaded - inserted)))
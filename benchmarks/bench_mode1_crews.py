@@ -0,0 +1,36 @@
+"""
+Benchmark of Mode1Navigator.select_islands_from_crew_numbers: per-crew descents of
+the order statistic tree against the NumPy engine (when NumPy is installed).
+
+Run from the repository root with:
+    python -m benchmarks.bench_mode1_crews
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+import mode1
+from mode1 import Mode1Navigator
+from benchmarks.bench_mode1_build import make_islands
+
+N = 10**5
+CREW_COUNTS = [N // 100, N // 8, N // 4, N // 2, N]
+
+
+if __name__ == "__main__":
+    nav = Mode1Navigator(make_islands(N), 1000)
+    total_marines = nav.bst_store.total_weight()
+    print("{0:>8}{1:>12}{2:>12}{3:>10}{4:>12}".format("crews", "tree s", "numpy s", "speedup", "max diff"))
+    for count in CREW_COUNTS:
+        RandomGen.set_seed(count)
+        crews = [RandomGen.randint(0, total_marines) for _ in range(count)]
+        start = time.perf_counter()
+        expected = [nav.bst_store.prefix_value(crew) for crew in crews]
+        tree_time = time.perf_counter() - start
+        if mode1.np is None:
+            print("{0:>8}{1:>12.3f}{2:>12}".format(count, tree_time, "no numpy"))
+            continue
+        start = time.perf_counter()
+        results = nav.build_crew_engine().select(crews)
+        numpy_time = time.perf_counter() - start
+        max_diff = max(abs(a - b) / max(1, abs(b)) for a, b in zip(results, expected))
+        print("{0:>8}{1:>12.3f}{2:>12.3f}{3:>9.2f}x{4:>12.1e}".format(count, tree_time, numpy_time, tree_time / numpy_time, max_diff))
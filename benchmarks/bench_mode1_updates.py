@@ -0,0 +1,47 @@
+"""
+Benchmark of Mode1Navigator updates: one update_island_by_name call per change
+against rebuilding bst_store once with the whole batch, and update_islands,
+which picks one of the two with BATCH_REBUILD_RATIO. The batch sizes go across
+the threshold N/BATCH_REBUILD_RATIO.
+
+Run from the repository root with:
+    python -m benchmarks.bench_mode1_updates
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+from mode1 import Mode1Navigator
+from benchmarks.bench_mode1_build import make_islands
+
+N = 10**5
+BATCH_SIZES = [N // 20, N // 10, N // 6, N // 4, N // 3, N // 2, N]
+
+
+def make_batch(n_islands: int, size: int) -> list[tuple[str, float, int]]:
+    RandomGen.set_seed(size)
+    return [(str(RandomGen.randint(0, n_islands - 1)), RandomGen.random() % 50000 + 1 + i / size, RandomGen.randint(1, 300))
+            for i in range(size)]
+
+
+def timed_updates(islands, batch, rebuild_ratio: int | None) -> float:
+    nav = Mode1Navigator(islands, 1000)
+    start = time.perf_counter()
+    if rebuild_ratio is None:
+        for name, money, marines in batch:
+            nav.update_island_by_name(name, money, marines)
+    else:
+        nav.BATCH_REBUILD_RATIO = rebuild_ratio
+        nav.update_islands(batch)
+    nav.select_islands()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    islands = make_islands(N)
+    print("{0:>8}{1:>10}{2:>12}{3:>10}{4:>12}".format("updates", "loop s", "rebuild s", "speedup", "auto s"))
+    for size in BATCH_SIZES:
+        batch = make_batch(N, size)
+        looped = timed_updates(islands, batch, None)
+        rebuilt = timed_updates(islands, batch, N)   # always rebuilds
+        auto = timed_updates(islands, batch, Mode1Navigator.BATCH_REBUILD_RATIO)
+        print("{0:>8}{1:>10.3f}{2:>12.3f}{3:>9.2f}x{4:>12.3f}".format(size, looped, rebuilt, looped / rebuilt, auto))
@@ -0,0 +1,50 @@
+"""
+Benchmark of the memory allocated by Mode2Navigator.simulate_day, measured with
+tracemalloc, with a new Island per plunder against in_place mode which changes
+the islands and returns (name, crew) records.
+
+Run from the repository root with:
+    python -m benchmarks.bench_mode2_alloc
+"""
+from __future__ import annotations
+import gc
+import time
+import tracemalloc
+from random_gen import RandomGen
+from island import Island
+from mode2 import Mode2Navigator, CrewScoreIndex
+
+N_ISLANDS = 10**4
+N_PIRATES = [10**4, 10**5]
+CREW = 20
+
+
+def make_islands(n: int) -> list[Island]:
+    RandomGen.set_seed(n)
+    return [Island(str(i), RandomGen.randint(1, 50000), RandomGen.randint(1, 3000)) for i in range(n)]
+
+
+def measure(n_pirates: int, in_place: bool) -> tuple[float, int, int]:
+    nav = Mode2Navigator(n_pirates, in_place=in_place, keep_index=True)
+    nav.add_islands(make_islands(N_ISLANDS))
+    nav.score_index = CrewScoreIndex.build(CREW, nav.island_dict, nav.worth_names)
+    gc.collect()
+    collections = sum(stats["collections"] for stats in gc.get_stats())
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = nav.simulate_day(CREW)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections
+    return elapsed, peak, collections
+
+
+if __name__ == "__main__":
+    print("{0:>8}{1:>10}{2:>10}{3:>12}{4:>8}".format("pirates", "mode", "time s", "peak KiB", "gc"))
+    for n_pirates in N_PIRATES:
+        for in_place in (False, True):
+            elapsed, peak, collections = measure(n_pirates, in_place)
+            print("{0:>8}{1:>10}{2:>10.3f}{3:>12.0f}{4:>8}".format(
+                n_pirates, "in place" if in_place else "copy", elapsed, peak / 1024, collections))
@@ -0,0 +1,44 @@
+"""
+Benchmark of Mode2Navigator over days with a different crew size every day: the
+score index kept between days with keep_index (only the islands whose marines lie
+between two crew sizes move) against days simulated on their own. The peak memory of
+a day with the kept index is measured with tracemalloc.
+
+Run from the repository root with:
+    python -m benchmarks.bench_mode2_crews
+"""
+from __future__ import annotations
+import time
+import tracemalloc
+from mode2 import Mode2Navigator
+from benchmarks.bench_mode2_days import make_islands
+
+N_ISLANDS = [10**5, 10**6]
+N_PIRATES = 100
+CREWS = [100, 101, 99, 105, 95, 110, 100, 102, 98, 100]
+
+
+if __name__ == "__main__":
+    print("{0:>8}{1:>12}{2:>12}{3:>10}{4:>14}".format("islands", "rebuild s", "kept s", "speedup", "day peak KiB"))
+    for n in N_ISLANDS:
+        islands = make_islands(n)
+        nav = Mode2Navigator(N_PIRATES)
+        nav.add_islands(islands)
+        start = time.perf_counter()
+        for crew in CREWS:
+            nav.simulate_day(crew)
+        rebuilt = time.perf_counter() - start
+        nav = Mode2Navigator(N_PIRATES, keep_index=True)
+        nav.add_islands(islands)
+        nav.simulate_day(CREWS[0])  # build the index
+        start = time.perf_counter()
+        for crew in CREWS[1:]:
+            nav.simulate_day(crew)
+        kept = time.perf_counter() - start
+        tracemalloc.start()
+        nav.simulate_day(CREWS[1])
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # compare the same number of days
+        kept = kept * len(CREWS) / (len(CREWS) - 1)
+        print("{0:>8}{1:>12.3f}{2:>12.3f}{3:>9.1f}x{4:>14.0f}".format(n, rebuilt, kept, rebuilt / kept, peak / 1024))
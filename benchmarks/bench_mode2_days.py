@@ -0,0 +1,48 @@
+"""
+Benchmark of Mode2Navigator over many days: simulate_days, which keeps the score
+index and the islands worth plundering between days (for the life of the generator,
+even without keep_index), against a loop of simulate_day calls without keep_index,
+which score every island again every day.
+
+Run from the repository root with:
+    python -m benchmarks.bench_mode2_days
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+from island import Island
+from mode2 import Mode2Navigator
+
+N_ISLANDS = [10**4, 10**5]
+N_PIRATES = 100
+N_DAYS = 30
+
+
+def make_islands(n: int) -> list[Island]:
+    RandomGen.set_seed(n)
+    return [Island(str(i), RandomGen.randint(1, 50000), RandomGen.randint(1, 300)) for i in range(n)]
+
+
+def make_crews(n_days: int) -> list[int]:
+    # the crew size changes once a week
+    return [100 + 10*(day // 7) for day in range(n_days)]
+
+
+if __name__ == "__main__":
+    crews = make_crews(N_DAYS)
+    print("{0:>8}{1:>12}{2:>12}{3:>10}".format("islands", "rebuild s", "days s", "speedup"))
+    for n in N_ISLANDS:
+        islands = make_islands(n)
+        nav = Mode2Navigator(N_PIRATES)
+        nav.add_islands(islands)
+        start = time.perf_counter()
+        for crew in crews:
+            nav.simulate_day(crew)
+        rebuilt = time.perf_counter() - start
+        nav = Mode2Navigator(N_PIRATES)
+        nav.add_islands(islands)
+        start = time.perf_counter()
+        for _ in nav.simulate_days(crews):
+            pass
+        kept = time.perf_counter() - start
+        print("{0:>8}{1:>12.3f}{2:>12.3f}{3:>9.2f}x".format(n, rebuilt, kept, rebuilt / kept))
@@ -0,0 +1,30 @@
+"""
+Benchmark of a run of Mode2Navigator pirates partially plundering the same island:
+a day of N pirates with one island large enough for all of them among a few small
+ones, with and without in_place.
+
+Run from the repository root with:
+    python -m benchmarks.bench_mode2_runs
+"""
+from __future__ import annotations
+import time
+from island import Island
+from mode2 import Mode2Navigator
+
+N_PIRATES = [10**5, 10**6]
+CREW = 10
+
+
+def make_islands(n_pirates: int) -> list[Island]:
+    return [Island("Big", 10.0**9, 2*CREW*n_pirates)] + [Island(str(i), 100, 40) for i in range(100)]
+
+
+if __name__ == "__main__":
+    print("{0:>10}{1:>10}{2:>10}".format("pirates", "in_place", "day s"))
+    for n in N_PIRATES:
+        for in_place in [False, True]:
+            nav = Mode2Navigator(n, in_place=in_place)
+            nav.add_islands(make_islands(n))
+            start = time.perf_counter()
+            nav.simulate_day(CREW)
+            print("{0:>10}{1:>10}{2:>10.3f}".format(n, str(in_place), time.perf_counter() - start))
@@ -0,0 +1,50 @@
+"""
+Scaling benchmark of Mode2Navigator.simulate_day_sharded over 1 to os.cpu_count()
+worker processes, against simulate_day (a day simulated on its own, with the best
+n_pirates islands selected by a bounded heap).
+The process pools are started before timing.
+
+Run from the repository root with:
+    python -m benchmarks.bench_mode2_sharded
+"""
+from __future__ import annotations
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from mode2 import Mode2Navigator
+from benchmarks.bench_mode2_days import make_islands
+
+N_ISLANDS = [10**5, 10**6]
+N_PIRATES = 100
+CREW = 100
+
+
+def worker_counts() -> list[int]:
+    counts = []
+    n_workers = 1
+    while n_workers < (os.cpu_count() or 1):
+        counts.append(n_workers)
+        n_workers *= 2
+    counts.append(os.cpu_count() or 1)
+    return counts
+
+
+if __name__ == "__main__":
+    print("{0:>8}{1:>9}{2:>12}{3:>10}".format("islands", "workers", "time s", "speedup"))
+    for n in N_ISLANDS:
+        islands = make_islands(n)
+        nav = Mode2Navigator(N_PIRATES)
+        nav.add_islands(islands)
+        start = time.perf_counter()
+        nav.simulate_day(CREW)
+        serial = time.perf_counter() - start
+        print("{0:>8}{1:>9}{2:>12.3f}{3:>9.2f}x".format(n, "serial", serial, 1))
+        for n_workers in worker_counts():
+            nav = Mode2Navigator(N_PIRATES)
+            nav.add_islands(islands)
+            with ProcessPoolExecutor(n_workers) as pool:
+                list(pool.map(abs, range(n_workers)))   # start the workers
+                start = time.perf_counter()
+                nav.simulate_day_sharded(CREW, n_workers, pool)
+                sharded = time.perf_counter() - start
+            print("{0:>8}{1:>9}{2:>12.3f}{3:>9.2f}x".format(n, n_workers, sharded, serial / sharded))
@@ -0,0 +1,43 @@
+"""
+Benchmark of the first day of Mode2Navigator at many islands and few pirates: a
+score heap of all the islands worth plundering, a score heap of only the best
+n_pirates of them (the default when there are more than TOP_K_RATIO times
+n_pirates), and the score index of keep_index. The time and peak memory of the
+day and the memory still allocated after it are measured with tracemalloc.
+
+Run from the repository root with:
+    python -m benchmarks.bench_mode2_topk
+"""
+from __future__ import annotations
+import time
+import tracemalloc
+from mode2 import Mode2Navigator
+from benchmarks.bench_mode2_days import make_islands
+
+N_ISLANDS = [10**5, 10**6]
+N_PIRATES = 100
+CREW = 100
+
+
+def measure(nav: Mode2Navigator) -> tuple[float, int, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = nav.simulate_day(CREW)
+    elapsed = time.perf_counter() - start
+    del results
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, current
+
+
+if __name__ == "__main__":
+    print("{0:>8}{1:>8}{2:>10}{3:>12}{4:>12}".format("islands", "heap", "time s", "peak KiB", "kept KiB"))
+    for n in N_ISLANDS:
+        islands = make_islands(n)
+        for mode in ["full", "top-k", "index"]:
+            nav = Mode2Navigator(N_PIRATES, keep_index=mode == "index")
+            if mode == "full":
+                nav.TOP_K_RATIO = n
+            nav.add_islands(islands)
+            elapsed, peak, kept = measure(nav)
+            print("{0:>8}{1:>8}{2:>10.3f}{3:>12.0f}{4:>12.0f}".format(n, mode, elapsed, peak / 1024, kept / 1024))
@@ -0,0 +1,71 @@
+"""
+Benchmark of the backend of ArrayR: a list (ArrayR) against a ctypes array of
+py_object (CTypesArrayR), on raw slot access and through the structures built
+on top of it, a MaxHeap of HeapKeys and a LinearProbeTable of island names.
+
+The structures look up ArrayR in their own module, so each run points that
+name at the backend being measured.
+
+Run from the repository root with:
+    python -m benchmarks.bench_referential_array
+"""
+from __future__ import annotations
+import time
+from random_gen import RandomGen
+import data_structures.heap as heap_module
+import data_structures.hash_table as hash_table_module
+from data_structures.referential_array import ArrayR, CTypesArrayR
+from mode2 import HeapKey
+
+N = 10**5
+BACKENDS = [("ctypes", CTypesArrayR), ("list", ArrayR)]
+
+
+def time_slots(backend) -> float:
+    array = backend(N)
+    start = time.perf_counter()
+    for i in range(N):
+        array[i] = i
+    for i in range(N):
+        array[i]
+    return time.perf_counter() - start
+
+
+def time_heap(keys: list[HeapKey]) -> float:
+    heap = heap_module.MaxHeap(1)
+    start = time.perf_counter()
+    for key in keys:
+        heap.add(key)
+    for _ in range(len(keys)):
+        heap.get_max()
+    return time.perf_counter() - start
+
+
+def time_table(names: list[str]) -> float:
+    table = hash_table_module.LinearProbeTable()
+    start = time.perf_counter()
+    for name in names:
+        table[name] = name
+    for name in names:
+        table[name]
+    for name in names:
+        del table[name]
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    RandomGen.set_seed(N)
+    keys = [HeapKey(str(i), RandomGen.random() % 100000) for i in range(N)]
+    names = ["Island " + str(i) for i in range(N)]
+    results = {}
+    for label, backend in BACKENDS:
+        heap_module.ArrayR = backend
+        hash_table_module.ArrayR = backend
+        results[label] = (time_slots(backend), time_heap(keys), time_table(names))
+    heap_module.ArrayR = ArrayR
+    hash_table_module.ArrayR = ArrayR
+
+    print("{0:>28}{1:>10}{2:>10}{3:>10}".format("", "ctypes s", "list s", "speedup"))
+    for i, label in enumerate(["2*10^5 slot accesses", "heap add+get_max", "table set+get+del"]):
+        before, after = results["ctypes"][i], results["list"][i]
+        print("{0:>28}{1:>10.3f}{2:>10.3f}{3:>9.2f}x".format(label, before, after, before / after))
@@ -0,0 +1,37 @@
+"""
+Benchmark of the probe lengths of the hash tables as they grow past the listed
+TABLE_SIZES, from 10^3 to 10^7 keys: LinearProbeTable and CachedHashTable (Robin
+Hood) at the default max_load_factor of 0.5, and CachedHashTable at 0.75.
+
+For every number of keys N a fresh table is filled with N island names, and the
+mean and longest distance of the keys from their home positions are reported.
+
+Run from the repository root with:
+    python -m benchmarks.bench_table_growth
+"""
+from __future__ import annotations
+import time
+from data_structures.hash_table import LinearProbeTable, CachedHashTable
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+TABLES = [
+    ("linear probe", lambda: LinearProbeTable()),
+    ("robin hood", lambda: CachedHashTable()),
+    ("robin hood 0.75", lambda: CachedHashTable(max_load_factor=0.75)),
+]
+
+
+if __name__ == "__main__":
+    print("{0:>16}{1:>10}{2:>11}{3:>7}{4:>9}{5:>8}{6:>9}".format(
+        "table", "keys", "size", "load", "mean", "max", "fill s"))
+    for label, make_table in TABLES:
+        for n in SIZES:
+            table = make_table()
+            start = time.perf_counter()
+            for i in range(n):
+                table["Island " + str(i)] = i
+            fill = time.perf_counter() - start
+            probes = table.probe_lengths()
+            print("{0:>16}{1:>10}{2:>11}{3:>7.2f}{4:>9.2f}{5:>8}{6:>9.1f}".format(
+                label, n, table.table_size, n / table.table_size, sum(probes) / n, max(probes), fill), flush=True)
+            del table, probes
@@ -3,7 +3,7 @@
 """
 
 from __future__ import annotations
-from set import *
+from data_structures.set import *
 from data_structures.referential_array import ArrayR
 
 class ASet(Set[T]):
@@ -77,9 +77,11 @@ class ASet(Set[T]):
         i.e. the result set should contains the elements of self and other.
         """
         res = ASet(len(self.array) + len(other.array))
-        for the_set in [self, other]:
-            for i in range(len(the_set)):
-                res.add(the_set.array[i])
+        # the elements of self are already distinct, so they are copied in one go
+        self.array.copy_into(res.array)
+        res.size = self.size
+        for i in range(len(other)):
+            res.add(other.array[i])
         return res
 
     def intersection(self, other: ASet[T]) -> ASet[T]:
@@ -0,0 +1,206 @@
+""" AVL Tree implemented on top of the Binary Search Tree ADT.
+    Defines a self-balancing Binary Search Tree with linked nodes.
+    Each node additionally stores the height of the subtree rooted at it,
+    which is used to rebalance the tree after every insertion and deletion.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import TypeVar, Generic
+from data_structures.bst import BinarySearchTree
+from data_structures.node import AVLTreeNode
+
+# generic types
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class AVLTree(BinarySearchTree, Generic[K, I]):
+    """ Self-balancing binary search tree.
+        The heights of the two child subtrees of any node differ by at most one,
+        thus the depth of the tree is bounded by O(logN), where N is the number of nodes.
+    """
+
+    def __init__(self) -> None:
+        """
+            Initialises an empty AVL Tree
+            :complexity: O(1)
+        """
+        BinarySearchTree.__init__(self)
+
+    def get_height(self, current: AVLTreeNode) -> int:
+        """
+            Get the height of a node. Return 0 if current is None
+            :complexity: O(1)
+        """
+        if current is not None:
+            return current.height
+        return 0
+
+    def get_balance(self, current: AVLTreeNode) -> int:
+        """
+            Compute the balance factor for the current sub-tree as the value
+            (left.height - right.height)
+            :complexity: O(1)
+        """
+        return self.get_height(current.left) - self.get_height(current.right)
+
+    def update_node(self, current: AVLTreeNode) -> None:
+        """
+            Recompute the information cached in current from its children.
+            :pre: the children of current are up to date
+            :complexity: O(1)
+        """
+        left_height = current.left.height if current.left is not None else 0
+        right_height = current.right.height if current.right is not None else 0
+        current.height = 1 + (left_height if left_height > right_height else right_height)
+
+    def create_node(self, key: K, item: I) -> AVLTreeNode:
+        """
+            Creates a node for this tree holding the key and item.
+            :complexity: O(1)
+        """
+        return AVLTreeNode(key, item)
+
+    def build_balanced(self, pairs: list[tuple[K, I]], lo: int, hi: int) -> AVLTreeNode:
+        """
+            Builds a perfectly balanced sub-tree out of pairs[lo:hi], using the middle
+            pair as the root, and returns its root with the heights filled in.
+            :pre: pairs is sorted by key
+            :complexity: O(hi - lo)
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        current = self.create_node(pairs[mid][0], pairs[mid][1])
+        current.left = self.build_balanced(pairs, lo, mid)
+        current.right = self.build_balanced(pairs, mid + 1, hi)
+        self.update_node(current)
+        return current
+
+    def insert_aux(self, current: AVLTreeNode, key: K, item: I) -> AVLTreeNode:
+        """
+            Attempts to insert an item into the tree, it uses the Key to insert it
+            and rebalances every node on the way back up.
+            :complexity: O(CompK * logN), where N is the number of nodes in the tree
+            CompK is the complexity of comparing the keys
+            :raises ValueError: if the key is already in the tree
+        """
+        if current is None:  # base case: at the leaf
+            current = self.create_node(key, item)
+            self.length += 1
+            return current
+        elif key < current.key:
+            current.left = self.insert_aux(current.left, key, item)
+        elif key > current.key:
+            current.right = self.insert_aux(current.right, key, item)
+        else:  # key == current.key
+            raise ValueError('Inserting duplicate item')
+        return self.rebalance(current)
+
+    def delete_aux(self, current: AVLTreeNode, key: K) -> AVLTreeNode:
+        """
+            Attempts to delete an item from the tree, it uses the Key to
+            determine the node to delete and rebalances every node on the way back up.
+            :complexity: O(CompK * logN), where N is the number of nodes in the tree
+            CompK is the complexity of comparing the keys
+            :raises ValueError: if the key is not in the tree
+        """
+        if current is None:  # key not found
+            raise ValueError('Deleting non-existent item')
+        elif key < current.key:
+            current.left = self.delete_aux(current.left, key)
+        elif key > current.key:
+            current.right = self.delete_aux(current.right, key)
+        else:  # we found our key => do actual deletion
+            if self.is_leaf(current):
+                self.length -= 1
+                return None
+            elif current.left is None:
+                self.length -= 1
+                return current.right
+            elif current.right is None:
+                self.length -= 1
+                return current.left
+
+            # general case => find a successor
+            succ = self.get_successor(current)
+            current.key = succ.key
+            current.item = succ.item
+            current.right = self.delete_aux(current.right, succ.key)
+
+        return self.rebalance(current)
+
+    def left_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Perform left rotation of the sub-tree.
+            Right child of the current node, i.e. of the root of the target
+            sub-tree, should become the new root of the sub-tree.
+            returns the new root of the subtree.
+            Example:
+
+                 current                                       child
+                /       \\                                      /     \\
+            l-tree     child           -------->        current     r-tree
+                      /     \\                           /     \\
+                 center     r-tree                 l-tree     center
+
+            :complexity: O(1)
+        """
+        child = current.right
+        current.right = child.left
+        child.left = current
+        self.update_node(current)
+        self.update_node(child)
+        return child
+
+    def right_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Perform right rotation of the sub-tree.
+            Left child of the current node, i.e. of the root of the target
+            sub-tree, should become the new root of the sub-tree.
+            returns the new root of the subtree.
+            Example:
+
+                       current                                child
+                      /       \\                              /     \\
+                  child       r-tree     --------->     l-tree     current
+                 /     \\                                           /     \\
+            l-tree     center                                 center     r-tree
+
+            :complexity: O(1)
+        """
+        child = current.left
+        current.left = child.right
+        child.right = current
+        self.update_node(current)
+        self.update_node(child)
+        return child
+
+    def rebalance(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Compute the balance of the current node.
+            Do rebalancing of the sub-tree of this node if necessary.
+            Rebalancing should be done either by:
+            - one left rotate
+            - one right rotate
+            - a combination of left + right rotate
+            - a combination of right + left rotate
+            returns the new root of the subtree.
+            :complexity: O(1)
+        """
+        self.update_node(current)
+        balance = self.get_balance(current)
+        if balance >= 2:
+            if self.get_balance(current.left) < 0:
+                current.left = self.left_rotate(current.left)
+            return self.right_rotate(current)
+
+        if balance <= -2:
+            if self.get_balance(current.right) > 0:
+                current.right = self.right_rotate(current.right)
+            return self.left_rotate(current)
+
+        return current
@@ -11,6 +11,7 @@ __docformat__ = 'reStructuredText'
 from typing import TypeVar, Generic
 from data_structures.linked_stack import LinkedStack
 from data_structures.node import TreeNode
+from algorithms.mergesort import mergesort
 import sys
 
 
@@ -132,6 +133,55 @@ class BinarySearchTree(Generic[K, I]):
         self.root = None
         self.length = 0
 
+    @classmethod
+    def from_items(cls, pairs: list[tuple[K, I]], **kwargs) -> BinarySearchTree[K, I]:
+        """
+            Creates a tree holding all the (key, item) pairs, in any order.
+            The pairs are sorted once with mergesort (skipped if they already are sorted)
+            and the tree is then built perfectly balanced from the sorted run.
+            Keyword arguments are passed on to the constructor of the tree.
+            :complexity best: O(N * CompK) the pairs are already sorted by key
+            :complexity worst: O(NlogN * CompK) where N is the number of pairs
+            :raises ValueError: if two pairs have the same key
+        """
+        pairs = list(pairs)
+        for i in range(1, len(pairs)):
+            if not pairs[i-1][0] < pairs[i][0]:
+                pairs = mergesort(pairs, key=lambda pair: pair[0])
+                break
+        return cls.from_sorted_items(pairs, **kwargs)
+
+    @classmethod
+    def from_sorted_items(cls, pairs: list[tuple[K, I]], **kwargs) -> BinarySearchTree[K, I]:
+        """
+            Creates a perfectly balanced tree from (key, item) pairs sorted by key.
+            Keyword arguments are passed on to the constructor of the tree.
+            :complexity: O(N * CompK) where N is the number of pairs
+            :raises ValueError: if the keys are not strictly increasing
+        """
+        for i in range(1, len(pairs)):
+            if not pairs[i-1][0] < pairs[i][0]:
+                raise ValueError('Inserting duplicate item')
+        tree = cls(**kwargs)
+        tree.root = tree.build_balanced(pairs, 0, len(pairs))
+        tree.length = len(pairs)
+        return tree
+
+    def build_balanced(self, pairs: list[tuple[K, I]], lo: int, hi: int) -> TreeNode:
+        """
+            Builds a perfectly balanced sub-tree out of pairs[lo:hi], using the middle
+            pair as the root, and returns its root.
+            :pre: pairs is sorted by key
+            :complexity: O(hi - lo)
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        current = TreeNode(pairs[mid][0], pairs[mid][1])
+        current.left = self.build_balanced(pairs, lo, mid)
+        current.right = self.build_balanced(pairs, mid + 1, hi)
+        return current
+
     def is_empty(self) -> bool:
         """
             Checks to see if the bst is empty
@@ -173,36 +223,52 @@ class BinarySearchTree(Generic[K, I]):
         return self.get_tree_node_by_key_aux(self.root, key)
 
     def get_tree_node_by_key_aux(self, current: TreeNode, key: K) -> TreeNode:
-        if current is None:  # base case: empty
-            raise KeyError('Key not found: {0}'.format(key))
-        elif key == current.key:  # base case: found
-            return current
-        elif key < current.key:
-            return self.get_tree_node_by_key_aux(current.left, key)
-        else:  # key > current.key
-            return self.get_tree_node_by_key_aux(current.right, key)
+        """
+            Walks down from current to the node holding the key, without recursion.
+            :complexity best: O(CompK) finds the item at current
+            :complexity worst: O(CompK * D) item is not found, where D is the depth of the tree
+            :raises KeyError: if the key is not in the subtree rooted at current
+        """
+        while current is not None:
+            if key < current.key:
+                current = current.left
+            elif key > current.key:
+                current = current.right
+            else:  # key == current.key
+                return current
+        raise KeyError('Key not found: {0}'.format(key))
 
     def __setitem__(self, key: K, item: I) -> None:
         self.root = self.insert_aux(self.root, key, item)
 
     def insert_aux(self, current: TreeNode, key: K, item: I) -> TreeNode:
         """
-            Attempts to insert an item into the tree, it uses the Key to insert it
+            Attempts to insert an item into the tree, it uses the Key to insert it.
+            Walks down to the leaf position with a loop and returns the (unchanged) root of the sub-tree.
             :complexity best: O(CompK) inserts the item at the root.
             :complexity worst: O(CompK * D) inserting at the bottom of the tree
             where D is the depth of the tree
             CompK is the complexity of comparing the keys
         """
-        if current is None:  # base case: at the leaf
-            current = TreeNode(key, item)
+        if current is None:  # empty sub-tree: the new node becomes its root
             self.length += 1
-        elif key < current.key:
-            current.left = self.insert_aux(current.left, key, item)
-        elif key > current.key:
-            current.right = self.insert_aux(current.right, key, item)
-        else:  # key == current.key
-            raise ValueError('Inserting duplicate item')
-        return current
+            return TreeNode(key, item)
+        root = current
+        while True:
+            if key < current.key:
+                if current.left is None:
+                    current.left = TreeNode(key, item)
+                    break
+                current = current.left
+            elif key > current.key:
+                if current.right is None:
+                    current.right = TreeNode(key, item)
+                    break
+                current = current.right
+            else:  # key == current.key
+                raise ValueError('Inserting duplicate item')
+        self.length += 1
+        return root
 
     def __delitem__(self, key: K) -> None:
         self.root = self.delete_aux(self.root, key)
@@ -210,33 +276,44 @@ class BinarySearchTree(Generic[K, I]):
     def delete_aux(self, current: TreeNode, key: K) -> TreeNode:
         """
             Attempts to delete an item from the tree, it uses the Key to
-            determine the node to delete.
+            determine the node to delete. Walks down with a loop and returns the
+            new root of the sub-tree.
+            :complexity best: O(CompK) deleting a root with at most one child
+            :complexity worst: O(CompK * D) where D is the depth of the tree
         """
-
+        root = current
+        parent = None
+        while current is not None:
+            if key < current.key:
+                parent, current = current, current.left
+            elif key > current.key:
+                parent, current = current, current.right
+            else:  # we found our key => do actual deletion
+                break
         if current is None:  # key not found
             raise ValueError('Deleting non-existent item')
-        elif key < current.key:
-            current.left  = self.delete_aux(current.left, key)
-        elif key > current.key:
-            current.right = self.delete_aux(current.right, key)
-        else:  # we found our key => do actual deletion
-            if self.is_leaf(current):
-                self.length -= 1
-                return None
-            elif current.left is None:
-                self.length -= 1
-                return current.right
-            elif current.right is None:
-                self.length -= 1
-                return current.left
-
-            # general case => find a successor
-            succ = self.get_successor(current)
-            current.key  = succ.key
-            current.item = succ.item
-            current.right = self.delete_aux(current.right, succ.key)
 
-        return current
+        if current.left is not None and current.right is not None:
+            # general case => copy the successor over and remove the successor node instead,
+            # which has no left child
+            succ_parent = current
+            succ = current.right
+            while succ.left is not None:
+                succ_parent, succ = succ, succ.left
+            current.key = succ.key
+            current.item = succ.item
+            parent, current = succ_parent, succ
+
+        # current has at most one child, which takes its place
+        child = current.left if current.left is not None else current.right
+        self.length -= 1
+        if parent is None:
+            return child
+        if parent.left is current:
+            parent.left = child
+        else:
+            parent.right = child
+        return root
 
     def get_successor(self, current: TreeNode) -> TreeNode:
         """
@@ -255,9 +332,9 @@ class BinarySearchTree(Generic[K, I]):
         """
         if current is None:
             return None
-        if current.left is None:
-            return current
-        return self.get_minimal(current.left)
+        while current.left is not None:
+            current = current.left
+        return current
 
     def is_leaf(self, current: TreeNode) -> bool:
         """ Simple check whether or not the node is a leaf. """
@@ -7,16 +7,57 @@ __author__ = 'Jackson Goerner'
 __since__ = '07/02/2023'
 
 
-from typing import TypeVar, Generic
+from typing import Callable, TypeVar, Generic
 from data_structures.referential_array import ArrayR
 
 K = TypeVar('K')
 V = TypeVar('V')
 
+HASH_BASE = 31
+
+
 class FullError(Exception):
     pass
 
 
+def builtin_hash(key: K, table_size: int) -> int:
+    """
+    Hash a key with Python's builtin hash, reduced to the table size.
+    Strings cache their builtin hash, so this is O(1) after the first call for a given string,
+    but the hash of a string changes from one run to the next (see PYTHONHASHSEED).
+
+    :complexity: O(len(key)) the first time, O(1) afterwards for strings
+    """
+    return hash(key) % table_size
+
+
+def next_prime(n: int) -> int:
+    """
+    Smallest prime which is at least n.
+
+    :complexity: O(G*sqrt(n)) where G is the gap to the next prime
+    """
+    candidate = max(n, 2)
+    while any(candidate % divisor == 0 for divisor in range(2, int(candidate ** 0.5) + 1)):
+        candidate += 1
+    return candidate
+
+
+def polynomial_hash(key: K, table_size: int) -> int:
+    """
+    Hash a key with a polynomial in its characters, whose coefficients depend on the table size.
+    Slower than builtin_hash, but the same key always gets the same position.
+
+    :complexity: O(len(key))
+    """
+    value = 0
+    a = 31415
+    for char in key:
+        value = (ord(char) + a * value) % table_size
+        a = a * HASH_BASE % (table_size - 1)
+    return value
+
+
 class LinearProbeTable(Generic[K, V]):
     """
     Linear Probe Table.
@@ -26,37 +67,54 @@ class LinearProbeTable(Generic[K, V]):
                 Otherwise `hash` should be overwritten.
         - V:    Value Type.
 
+    The position of a key is given by the hasher, a function from a key and the table size
+    to a position in the table: builtin_hash (the default) or polynomial_hash, for positions
+    which are the same in every run. With memo, the home position of every key in the table
+    is kept from its insertion until it is deleted, so that lookups of the keys in the table
+    do not hash them again. Lookups of missing keys do not add to the memo.
+
+    The table grows to the next size before a new key would take more than max_load_factor
+    of it, and shrinks to the previous one once less than a quarter of that is taken, after
+    deletions, as long as the keys fit in the previous size within max_load_factor. The table
+    is never full when a new key comes, so FullError is not raised.
+
     Unless stated otherwise, all methods have O(1) complexity.
     """
 
-    # No test case should exceed 1 million entries.
+    # Past the last size, every size is the first prime after twice the previous one.
     TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869]
 
-    HASH_BASE = 31
+    HASH_BASE = HASH_BASE
 
-    def __init__(self, sizes=None) -> None:
+    def __init__(self, sizes=None, hasher: Callable[[K, int], int] = builtin_hash, memo: bool = False,
+                 max_load_factor: float = 0.5) -> None:
         """
         Initialise the Hash Table.
+        :raises ValueError: if max_load_factor is not in (0, 1]
         """
-        if sizes is not None:
-            self.TABLE_SIZES = sizes
+        if not 0 < max_load_factor <= 1:
+            raise ValueError("Maximum load factor should be in (0, 1], not {0}.".format(max_load_factor))
+        # a copy, as the sizes past the last one are appended to it
+        self.TABLE_SIZES = list(sizes if sizes is not None else self.TABLE_SIZES)
+        self.max_load_factor = max_load_factor
         self.size_index = 0
         self.array:ArrayR[tuple[K, V]] = ArrayR(self.TABLE_SIZES[self.size_index])
         self.count = 0
+        self.hasher = hasher
+        self.hash_memo: dict[K, int] | None = {} if memo else None
 
     def hash(self, key: K) -> int:
         """
         Hash a key for insert/retrieve/update into the hashtable.
 
-        :complexity: O(len(key))
+        :complexity: O(hasher(key)), O(1) if the key is in the memo
         """
-
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
+        if self.hash_memo is not None:
+            try:
+                return self.hash_memo[key]
+            except KeyError:
+                pass
+        return self.hasher(key, self.table_size)
 
     @property
     def table_size(self) -> int:
@@ -68,9 +126,10 @@ class LinearProbeTable(Generic[K, V]):
         """
         return self.count
 
-    def _linear_probe(self, key: K, is_insert: bool) -> int:
+    def _linear_probe(self, key: K, is_insert: bool, position: int | None = None) -> int:
         """
-        Find the correct position for this key in the hash table using linear probing.
+        Find the correct position for this key in the hash table using linear probing,
+        starting from its home position, which is hashed unless given.
         :complexity best: O(hash(key)) first position is empty
         :complexity worst: O(hash(key) + N*comp(K)) when we've searched the entire table
                         where N is the tablesize
@@ -78,7 +137,8 @@ class LinearProbeTable(Generic[K, V]):
         :raises FullError: When a table is full and cannot be inserted.
         """
         # Initial position
-        position = self.hash(key)
+        if position is None:
+            position = self.hash(key)
 
         for _ in range(self.table_size):
             if self.array[position] is None:
@@ -104,11 +164,7 @@ class LinearProbeTable(Generic[K, V]):
 
         :complexity: O(N) where N is self.table_size.
         """
-        res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][0])
-        return res
+        return [item[0] for item in self.array if item is not None]
 
     def values(self) -> list[V]:
         """
@@ -116,11 +172,7 @@ class LinearProbeTable(Generic[K, V]):
 
         :complexity: O(N) where N is self.table_size.
         """
-        res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][1])
-        return res
+        return [item[1] for item in self.array if item is not None]
 
     def __contains__(self, key: K) -> bool:
         """
@@ -150,19 +202,26 @@ class LinearProbeTable(Generic[K, V]):
         Set an (key, value) pair in our hash table.
 
         :complexity: See linear probe.
-        :raises FullError: when the table cannot be resized further.
         """
-
-        position = self._linear_probe(key, True)
-
-        if self.array[position] is None:
+        home = self.hash(key)
+        try:
+            position = self._linear_probe(key, True, home)
+        except FullError:
+            # a new key, with a max_load_factor of 1 the table grows below
+            position = None
+
+        if position is None or self.array[position] is None:
+            # grow before the new key goes over the maximum load factor
+            if self.count + 1 > self.table_size * self.max_load_factor:
+                self._rehash()
+                home = self.hash(key)
+                position = self._linear_probe(key, True, home)
             self.count += 1
+            if self.hash_memo is not None:
+                self.hash_memo[key] = home
 
         self.array[position] = (key, data)
 
-        if len(self) > self.table_size / 2:
-            self._rehash()
-
     def __delitem__(self, key: K) -> None:
         """
         Deletes a (key, value) pair in our hash table.
@@ -175,6 +234,8 @@ class LinearProbeTable(Generic[K, V]):
         # Remove the element
         self.array[position] = None
         self.count -= 1
+        if self.hash_memo is not None:
+            del self.hash_memo[key]
         # Start moving over the cluster
         position = (position + 1) % self.table_size
         while self.array[position] is not None:
@@ -185,13 +246,37 @@ class LinearProbeTable(Generic[K, V]):
             self.array[newpos] = (key2, value)
             position = (position + 1) % self.table_size
 
+        if self.is_sparse():
+            self._rehash(grow=False)
+
     def is_empty(self) -> bool:
         return self.count == 0
 
     def is_full(self) -> bool:
         return self.count == self.table_size
 
-    def _rehash(self) -> None:
+    def is_sparse(self) -> bool:
+        """
+        True if the table is not the smallest one, less than a quarter of
+        max_load_factor of it is taken and the keys fit in the previous size
+        within max_load_factor, so that it should shrink.
+        """
+        return (self.size_index > 0 and self.count < self.table_size * self.max_load_factor / 4
+                and self.count <= self.TABLE_SIZES[self.size_index - 1] * self.max_load_factor)
+
+    def _next_size(self, grow: bool) -> int:
+        """
+        Move size_index to the next (or previous) size and return that size,
+        adding a new size after the last one if needed.
+
+        :complexity: O(1), or that of next_prime when a new size is added
+        """
+        self.size_index += 1 if grow else -1
+        if self.size_index == len(self.TABLE_SIZES):
+            self.TABLE_SIZES.append(next_prime(2 * self.TABLE_SIZES[-1] + 1))
+        return self.TABLE_SIZES[self.size_index]
+
+    def _rehash(self, grow: bool = True) -> None:
         """
         Need to resize table and reinsert all values
 
@@ -200,16 +285,26 @@ class LinearProbeTable(Generic[K, V]):
         Where N is len(self)
         """
         old_array = self.array
-        self.size_index += 1
-        if self.size_index >= len(self.TABLE_SIZES):
-            # Cannot be resized further.
-            return
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
-        self.count = 0
+        self.array = ArrayR(self._next_size(grow))
+        size = len(self.array)
+        # the keys are distinct and fit in the new table, so every item is placed as it is,
+        # without going through __setitem__ and its count and load checks
         for item in old_array:
             if item is not None:
-                key, value = item
-                self[key] = value
+                home = self.hasher(item[0], size)
+                if self.hash_memo is not None:
+                    # the positions in the memo are those for the old size
+                    self.hash_memo[item[0]] = home
+                self.array[self._linear_probe(item[0], True, home)] = item
+
+    def probe_lengths(self) -> list[int]:
+        """
+        Distance of every key in the table from its home position.
+
+        :complexity: O(N*hash(K)) where N is self.table_size.
+        """
+        size = self.table_size
+        return [(position - self.hash(item[0])) % size for position, item in enumerate(self.array) if item is not None]
 
     def __str__(self) -> str:
         """
@@ -223,3 +318,220 @@ class LinearProbeTable(Generic[K, V]):
                 (key, value) = item
                 result += "(" + str(key) + "," + str(value) + ")\n"
         return result
+
+
+class CachedHashTable(LinearProbeTable[K, V]):
+    """
+    Open addressing table which stores the full hash of every key next to it, as
+    (hash, key, value) triples, with the same interface as LinearProbeTable.
+
+    - The full hash is given by the hasher for a size much larger than any table, so it
+      does not depend on the table size and is computed once per key:
+      resizing moves the triples to their new positions without hashing the keys again,
+      and probing only compares keys whose hashes are equal.
+    - Deleting uses backward shift instead of reinserting the rest of the cluster: the
+      following entries of the cluster which may move are shifted back one by one into
+      the hole, so no tombstones are needed.
+    - With robin_hood (the default) an entry which is further from its home position
+      takes the place of one which is closer, which keeps every probe short and lets a
+      search for a missing key stop as soon as it reaches an entry closer to its home.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    # modulus of the full hash, a Mersenne prime much larger than any table size
+    FULL_HASH_MOD = 2**61 - 1
+    # multiplier (2**64 divided by the golden ratio) applied to the hash given by the hasher, so
+    # that keys which only differ in their last character do not get neighbouring positions
+    # when the hasher is polynomial_hash
+    HASH_MIX = 0x9E3779B97F4A7C15
+
+    def __init__(self, sizes=None, robin_hood: bool = True, hasher: Callable[[K, int], int] = builtin_hash,
+                 memo: bool = False, max_load_factor: float = 0.5) -> None:
+        """
+        Initialise the Hash Table.
+        :raises ValueError: if max_load_factor is not in (0, 1]
+        """
+        LinearProbeTable.__init__(self, sizes, hasher, memo, max_load_factor)
+        self.robin_hood = robin_hood
+
+    def full_hash(self, key: K) -> int:
+        """
+        Hash a key independently of the table size. Full hashes do not change
+        when the table is resized, so the memo is not changed by resizing.
+
+        :complexity: O(hasher(key)), O(1) if the key is in the memo
+        """
+        if self.hash_memo is not None:
+            try:
+                return self.hash_memo[key]
+            except KeyError:
+                pass
+        return self.hasher(key, self.FULL_HASH_MOD) * self.HASH_MIX % self.FULL_HASH_MOD
+
+    def hash(self, key: K) -> int:
+        """
+        Home position of a key in the table.
+
+        :complexity: See full_hash.
+        """
+        return self.full_hash(key) % self.table_size
+
+    def _find(self, key: K, key_hash: int) -> int:
+        """
+        Position of the key with the given full hash in the table.
+        :complexity best: O(1) the key is at its home position
+        :complexity worst: O(P*comp(K)) where P is the longest probe sequence
+        :raises KeyError: When the key is not in the table.
+        """
+        the_array = self.array
+        size = len(the_array)
+        position = key_hash % size
+        for distance in range(size):
+            item = the_array[position]
+            if item is None:
+                break
+            if item[0] == key_hash and item[1] == key:
+                return position
+            if self.robin_hood and distance > (position - item[0]) % size:
+                # the key would have taken the place of this entry
+                break
+            position = (position + 1) % size
+        raise KeyError(key)
+
+    def _place(self, entry: tuple[int, K, V]) -> None:
+        """
+        Put a triple whose key is not in the table in the first free position of its probe
+        sequence, displacing on the way entries closer to their home if robin_hood is set.
+        :pre: the table is not full
+        :complexity: O(P) where P is the longest probe sequence
+        :raises FullError: if the table is full, after walking once around it
+        """
+        the_array = self.array
+        size = len(the_array)
+        position = entry[0] % size
+        distance = 0
+        for _ in range(size):
+            item = the_array[position]
+            if item is None:
+                the_array[position] = entry
+                return
+            if self.robin_hood:
+                item_distance = (position - item[0]) % size
+                if item_distance < distance:
+                    the_array[position] = entry
+                    entry = item
+                    distance = item_distance
+            position = (position + 1) % size
+            distance += 1
+        raise FullError("Table is full!")
+
+    def keys(self) -> list[K]:
+        """
+        Returns all keys in the hash table.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        return [item[1] for item in self.array if item is not None]
+
+    def values(self) -> list[V]:
+        """
+        Returns all values in the hash table.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        return [item[2] for item in self.array if item is not None]
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value at a certain key
+
+        :complexity: See _find.
+        :raises KeyError: when the key doesn't exist.
+        """
+        return self.array[self._find(key, self.full_hash(key))][2]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+
+        :complexity: O(hash(key) + P*comp(K)) where P is the longest probe sequence
+        """
+        key_hash = self.full_hash(key)
+        try:
+            position = self._find(key, key_hash)
+        except KeyError:
+            # grow before placing, so that the table is not full when the new key is placed
+            if self.count + 1 > self.table_size * self.max_load_factor:
+                self._rehash()
+            self._place((key_hash, key, data))
+            self.count += 1
+            if self.hash_memo is not None:
+                self.hash_memo[key] = key_hash
+        else:
+            self.array[position] = (key_hash, key, data)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table, shifting back the rest of its cluster.
+
+        :complexity: O(hash(key) + P*comp(K) + C) where P is the longest probe sequence
+                     and C the length of the cluster after the key
+        :raises KeyError: when the key doesn't exist.
+        """
+        the_array = self.array
+        size = len(the_array)
+        hole = self._find(key, self.full_hash(key))
+        the_array[hole] = None
+        self.count -= 1
+        if self.hash_memo is not None:
+            del self.hash_memo[key]
+        position = (hole + 1) % size
+        while the_array[position] is not None:
+            item = the_array[position]
+            # the entry may move back to the hole unless its home lies after the hole
+            # (cyclically) and at or before its position, with robin_hood these are
+            # exactly the entries away from their home
+            if (position - item[0]) % size >= (position - hole) % size:
+                the_array[hole] = item
+                the_array[position] = None
+                hole = position
+            position = (position + 1) % size
+        if self.is_sparse():
+            self._rehash(grow=False)
+
+    def _rehash(self, grow: bool = True) -> None:
+        """
+        Resize the table and move all the triples, reusing their cached hashes.
+
+        :complexity best: O(N) No probing.
+        :complexity worst: O(N^2) Lots of probing.
+        Where N is len(self)
+        """
+        old_array = self.array
+        self.array = ArrayR(self._next_size(grow))
+        for item in old_array:
+            if item is not None:
+                self._place(item)
+
+    def probe_lengths(self) -> list[int]:
+        """
+        Distance of every key in the table from its home position.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        size = self.table_size
+        return [(position - item[0]) % size for position, item in enumerate(self.array) if item is not None]
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular
+        order).
+        :complexity: O(N * (str(key) + str(value))) where N is the table size
+        """
+        result = ""
+        for item in self.array:
+            if item is not None:
+                (_, key, value) = item
+                result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
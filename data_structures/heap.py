@@ -3,12 +3,15 @@ from __future__ import annotations
 __author__ = "Brendon Taylor, modified by Jackson Goerner"
 __docformat__ = 'reStructuredText'
 
+from operator import gt, lt
 from typing import Generic
 from data_structures.referential_array import ArrayR, T
 
 
 class MaxHeap(Generic[T]):
     MIN_CAPACITY = 1
+    # order of the heap, higher(a, b) is True if a goes above b (MinHeap reverses it)
+    higher = staticmethod(gt)
 
     def __init__(self, max_size: int) -> None:
         self.length = 0
@@ -25,18 +28,20 @@ class MaxHeap(Generic[T]):
         Rise element at index k to its correct position
         :pre: 1 <= k <= self.length
         """
+        higher = self.higher
         item = self.the_array[k]
-        while k > 1 and item > self.the_array[k // 2]:
+        while k > 1 and higher(item, self.the_array[k // 2]):
             self.the_array[k] = self.the_array[k // 2]
             k = k // 2
         self.the_array[k] = item
 
     def add(self, element: T) -> bool:
         """
-        Swaps elements while rising
+        Swaps elements while rising, doubling the capacity of the heap when it is full
+        :complexity: O(logN * comp(T)), amortised over the resizes
         """
         if self.is_full():
-            raise IndexError
+            self._resize(2 * len(self.the_array))
 
         self.length += 1
         self.the_array[self.length] = element
@@ -44,12 +49,12 @@ class MaxHeap(Generic[T]):
 
     def largest_child(self, k: int) -> int:
         """
-        Returns the index of k's child with greatest value.
+        Returns the index of k's child with greatest value (the smallest one in a MinHeap).
         :pre: 1 <= k <= self.length // 2
         """
 
         if 2 * k == self.length or \
-                self.the_array[2 * k] > self.the_array[2 * k + 1]:
+                self.higher(self.the_array[2 * k], self.the_array[2 * k + 1]):
             return 2 * k
         else:
             return 2 * k + 1
@@ -59,11 +64,12 @@ class MaxHeap(Generic[T]):
             :pre: 1 <= k <= self.length
             :complexity: ???
         """
+        higher = self.higher
         item = self.the_array[k]
 
         while 2 * k <= self.length:
             max_child = self.largest_child(k)
-            if self.the_array[max_child] <= item:
+            if not higher(self.the_array[max_child], item):
                 break
             self.the_array[k] = self.the_array[max_child]
             k = max_child
@@ -82,17 +88,175 @@ class MaxHeap(Generic[T]):
             self.sink(1)
         return max_elt
 
+    def peek(self) -> T:
+        """
+        Returns the maximum element, without removing it.
+        :complexity: O(1)
+        :raises IndexError: if the heap is empty
+        """
+        if self.length == 0:
+            raise IndexError
+        return self.the_array[1]
+
+    def peek_second(self) -> T | None:
+        """
+        Returns the greatest element below the maximum (its largest child), without removing it,
+        or None if the heap holds less than two elements.
+        :complexity: O(comp(T)), O(d * comp(T)) for a DaryMaxHeap of arity d
+        """
+        if self.length < 2:
+            return None
+        return self.the_array[self.largest_child(1)]
+
+    def replace_top(self, element: T) -> T:
+        """
+        Remove (and return) the maximum element and add the given element, with a single sink.
+        The returned element may be smaller than the given one.
+        This saves the rise of add: little when the given element sinks deep, the whole
+        pop and add when it stays at the top (see benchmarks/bench_heap_replace.py).
+        :complexity: O(logN * comp(T))
+        :raises IndexError: if the heap is empty
+        """
+        if self.length == 0:
+            raise IndexError
+        max_elt = self.the_array[1]
+        self.the_array[1] = element
+        self.sink(1)
+        return max_elt
+
+    def pushpop(self, element: T) -> T:
+        """
+        Add the given element, then remove (and return) the maximum element, with at most a single sink.
+        :complexity: O(logN * comp(T)), O(1) if the given element is not smaller than the maximum
+        """
+        if self.length > 0 and self.higher(self.the_array[1], element):
+            return self.replace_top(element)
+        return element
+
+    def update(self, k: int, element: T) -> None:
+        """
+        Replace the element at index k with the given element, and move it to its correct position.
+        :pre: 1 <= k <= self.length
+        :complexity: O(logN * comp(T))
+        """
+        old = self.the_array[k]
+        self.the_array[k] = element
+        if self.higher(element, old):
+            self.rise(k)
+        else:
+            self.sink(k)
+
+    def _resize(self, new_size: int) -> None:
+        """
+        Move the elements into a new array of the given size.
+        :pre: new_size > self.length
+        :complexity: O(new_size)
+        """
+        self.the_array = self.the_array.resize(new_size)
+
     @classmethod
     def heapify(cls, points: ArrayR[T], overwrite_size: int = 0) -> MaxHeap[T]:
-        self = MaxHeap(overwrite_size or (2 * len(points) + 2))
+        self = cls(overwrite_size or (2 * len(points) + 2))
         self.length = len(points)
-        for i in range(len(points)):
-            self.the_array[i+1] = points[i]
+        self.the_array.set_slice(1, points)
         for k in range(len(points), 0, -1):
             self.sink(k)
         return self
 
 
+class DaryMaxHeap(MaxHeap[T]):
+    """
+    Max Heap where every node has up to `arity` children instead of 2, with the same API as MaxHeap.
+    With the root at index 1, the children of index k are at indices arity*(k-1)+2 to arity*k+1,
+    and its parent is at index (k-2)//arity+1 (for arity 2 these are 2k, 2k+1 and k//2).
+    The tree is only log_arity(N) deep, so rise and add take fewer steps, while sink and get_max
+    compare up to arity children per step.
+    """
+
+    def __init__(self, max_size: int, arity: int = 4) -> None:
+        MaxHeap.__init__(self, max_size)
+        self.arity = arity
+
+    def rise(self, k: int) -> None:
+        """
+        Rise element at index k to its correct position
+        :pre: 1 <= k <= self.length
+        :complexity: O(log_d(N) * comp(T)), where d is the arity
+        """
+        the_array = self.the_array
+        arity = self.arity
+        item = the_array[k]
+        while k > 1:
+            parent = (k - 2) // arity + 1
+            parent_item = the_array[parent]
+            if not item > parent_item:
+                break
+            the_array[k] = parent_item
+            k = parent
+        the_array[k] = item
+
+    def largest_child(self, k: int) -> int:
+        """
+        Returns the index of k's child with greatest value.
+        :pre: 1 <= k <= (self.length + arity - 2) // arity, i.e. k has at least one child
+        :complexity: O(d * comp(T)), where d is the arity
+        """
+        if self.arity == 2:
+            return MaxHeap.largest_child(self, k)
+        the_array = self.the_array
+        first = self.arity * (k - 1) + 2
+        last = min(first + self.arity - 1, self.length)
+        largest = first
+        largest_item = the_array[first]
+        for child in range(first + 1, last + 1):
+            child_item = the_array[child]
+            if child_item > largest_item:
+                largest = child
+                largest_item = child_item
+        return largest
+
+    def sink(self, k: int) -> None:
+        """ Make the element at index k sink to the correct position.
+            :pre: 1 <= k <= self.length
+            :complexity: O(d * log_d(N) * comp(T)), where d is the arity
+        """
+        the_array = self.the_array
+        item = the_array[k]
+
+        while self.arity * (k - 1) + 2 <= self.length:
+            max_child = self.largest_child(k)
+            if the_array[max_child] <= item:
+                break
+            the_array[k] = the_array[max_child]
+            k = max_child
+
+        the_array[k] = item
+
+    @classmethod
+    def heapify(cls, points: ArrayR[T], overwrite_size: int = 0, arity: int = 4) -> DaryMaxHeap[T]:
+        """
+        Build a heap out of the points in linear time.
+        :complexity: O(N * comp(T)), where N is the number of points
+        """
+        self = cls(overwrite_size or (2 * len(points) + 2), arity)
+        self.length = len(points)
+        self.the_array.set_slice(1, points)
+        # the last node with a child is the parent of the last node
+        for k in range((len(points) - 2) // arity + 1, 0, -1):
+            self.sink(k)
+        return self
+
+
+class MinHeap(MaxHeap[T]):
+    """
+    Min Heap implemented using an array: a MaxHeap with the order reversed, so that
+    the smallest element is at the top. get_min is get_max under its Min Heap name.
+    """
+    higher = staticmethod(lt)
+
+    get_min = MaxHeap.get_max
+
+
 if __name__ == '__main__':
     items = [ int(x) for x in input('Enter a list of numbers: ').strip().split() ]
     heap = MaxHeap(len(items))
@@ -0,0 +1,212 @@
+"""Max Heap with a position map, so that elements can be found, updated and removed by name"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+from typing import Callable, Generic, Hashable
+from data_structures.heap import MaxHeap, DaryMaxHeap
+from data_structures.referential_array import T
+
+
+class IndexedMaxHeap(DaryMaxHeap[T], Generic[T]):
+    """
+    Max Heap which keeps a dictionary from the name of every element, given by the `key`
+    function, to its position in the array. Every move of an element during rise and sink
+    also updates its position, so that the element with a given name can be updated or
+    removed in O(log N) without searching for it.
+
+    Names must be unique within the heap. The heap is binary by default, and d-ary
+    (see DaryMaxHeap) for any other `arity`.
+    """
+
+    def __init__(self, max_size: int, key: Callable[[T], Hashable] = lambda x: x, arity: int = 2) -> None:
+        DaryMaxHeap.__init__(self, max_size, arity)
+        self.key = key
+        self.index: dict[Hashable, int] = {}
+
+    def __contains__(self, name: Hashable) -> bool:
+        """
+        True if an element with this name is in the heap.
+        :complexity: O(1)
+        """
+        return name in self.index
+
+    def get(self, name: Hashable) -> T:
+        """
+        Returns the element with this name, without removing it.
+        :complexity: O(1)
+        :raises KeyError: if there is no element with this name
+        """
+        return self.the_array[self.index[name]]
+
+    def rise(self, k: int) -> None:
+        """
+        Rise element at index k to its correct position, updating the positions of the moved elements.
+        :pre: 1 <= k <= self.length
+        :complexity: O(log_d(N) * comp(T)), where d is the arity
+        """
+        the_array = self.the_array
+        arity = self.arity
+        item = the_array[k]
+        while k > 1:
+            parent = (k - 2) // arity + 1
+            parent_item = the_array[parent]
+            if not item > parent_item:
+                break
+            the_array[k] = parent_item
+            self.index[self.key(parent_item)] = k
+            k = parent
+        the_array[k] = item
+        self.index[self.key(item)] = k
+
+    def sink(self, k: int) -> None:
+        """
+        Make the element at index k sink to the correct position, updating the positions of the moved elements.
+        :pre: 1 <= k <= self.length
+        :complexity: O(d * log_d(N) * comp(T)), where d is the arity
+        """
+        the_array = self.the_array
+        item = the_array[k]
+
+        while self.arity * (k - 1) + 2 <= self.length:
+            max_child = self.largest_child(k)
+            child = the_array[max_child]
+            if child <= item:
+                break
+            the_array[k] = child
+            self.index[self.key(child)] = k
+            k = max_child
+
+        the_array[k] = item
+        self.index[self.key(item)] = k
+
+    def add(self, element: T) -> None:
+        """
+        Add an element, doubling the capacity of the heap when it is full.
+        :complexity: O(logN * comp(T)), amortised over the resizes
+        :raises ValueError: if an element with the same name is already in the heap
+        """
+        if self.key(element) in self.index:
+            raise ValueError('Adding duplicate name')
+        MaxHeap.add(self, element)
+
+    def get_max(self) -> T:
+        """
+        Remove (and return) the maximum element from the heap.
+        :complexity: O(logN * comp(T))
+        :raises IndexError: if the heap is empty
+        """
+        if self.length == 0:
+            raise IndexError
+
+        max_elt = self.the_array[1]
+        del self.index[self.key(max_elt)]
+        self.length -= 1
+        if self.length > 0:
+            self.the_array[1] = self.the_array[self.length+1]
+            self.sink(1)
+        return max_elt
+
+    def replace_top(self, element: T) -> T:
+        """
+        Remove (and return) the maximum element and add the given element, with a single sink.
+        The given element may have the same name as the maximum element.
+        :complexity: O(logN * comp(T))
+        :raises IndexError: if the heap is empty
+        :raises ValueError: if another element in the heap has the same name as the given element
+        """
+        if self.length == 0:
+            raise IndexError
+        self.forget(self.the_array[1], element)
+        return MaxHeap.replace_top(self, element)
+
+    def update(self, k: int, element: T) -> None:
+        """
+        Replace the element at index k with the given element, and move it to its correct position.
+        The given element may have the same name as the element it replaces.
+        :pre: 1 <= k <= self.length
+        :complexity: O(logN * comp(T))
+        :raises ValueError: if another element in the heap has the same name as the given element
+        """
+        self.forget(self.the_array[k], element)
+        MaxHeap.update(self, k, element)
+
+    def forget(self, old: T, element: T) -> None:
+        """
+        Remove the name of old from the index, before it is replaced by element.
+        :complexity: O(1)
+        :raises ValueError: if another element in the heap has the same name as element
+        """
+        old_name = self.key(old)
+        if self.key(element) != old_name and self.key(element) in self.index:
+            raise ValueError('Adding duplicate name')
+        del self.index[old_name]
+
+    def update_element(self, element: T) -> None:
+        """
+        Replace the element with the same name as the given element, and move it
+        up or down to its correct position.
+        :complexity: O(logN * comp(T))
+        :raises KeyError: if there is no element with this name
+        """
+        self.update(self.index[self.key(element)], element)
+
+    def increase_key(self, element: T) -> None:
+        """
+        Replace the element with the same name by the given element, which must not be smaller.
+        :complexity: O(logN * comp(T))
+        :raises KeyError: if there is no element with this name
+        :raises ValueError: if the given element is smaller than the one it replaces
+        """
+        if element < self.get(self.key(element)):
+            raise ValueError('New element is smaller than the current one')
+        self.update_element(element)
+
+    def decrease_key(self, element: T) -> None:
+        """
+        Replace the element with the same name by the given element, which must not be larger.
+        :complexity: O(logN * comp(T))
+        :raises KeyError: if there is no element with this name
+        :raises ValueError: if the given element is larger than the one it replaces
+        """
+        if element > self.get(self.key(element)):
+            raise ValueError('New element is larger than the current one')
+        self.update_element(element)
+
+    def remove(self, name: Hashable) -> T:
+        """
+        Remove (and return) the element with this name.
+        :complexity: O(logN * comp(T))
+        :raises KeyError: if there is no element with this name
+        """
+        k = self.index.pop(name)
+        removed = self.the_array[k]
+        last = self.the_array[self.length]
+        self.length -= 1
+        if k <= self.length:
+            # the last element takes the place of the removed one
+            self.the_array[k] = last
+            self.index[self.key(last)] = k
+            if last > removed:
+                self.rise(k)
+            else:
+                self.sink(k)
+        return removed
+
+    @classmethod
+    def heapify(cls, points: list[T], key: Callable[[T], Hashable] = lambda x: x,
+                overwrite_size: int = 0, arity: int = 2) -> IndexedMaxHeap[T]:
+        """
+        Build an indexed heap out of the points in linear time.
+        :complexity: O(N * comp(T)), where N is the number of points
+        :raises ValueError: if two points have the same name
+        """
+        self = cls(overwrite_size or (2 * len(points) + 2), key, arity)
+        self.length = len(points)
+        self.the_array.set_slice(1, points)
+        self.index = {key(point): k for k, point in enumerate(self.the_array[1:len(points)+1], 1)}
+        if len(self.index) != len(points):
+            raise ValueError('Adding duplicate name')
+        # the last node with a child is the parent of the last node
+        for k in range((len(points) - 2) // arity + 1, 0, -1):
+            self.sink(k)
+        return self
@@ -46,3 +46,22 @@ class AVLTreeNode(TreeNode, Generic[K, I]):
 
         super(AVLTreeNode, self).__init__(key, item)
         self.height = 1
+
+
+class OrderStatisticTreeNode(AVLTreeNode, Generic[K, I]):
+    """ Node class for order statistic trees.
+        Besides the height, it caches the number of nodes and the total
+        weight and value of the items in the subtree rooted at it.
+    """
+
+    def __init__(self, key: K, item: I = None) -> None:
+        """
+            Initialises the node with a key and optional item
+            and sets the left and right pointers to None
+            :complexity: O(1)
+        """
+
+        super(OrderStatisticTreeNode, self).__init__(key, item)
+        self.size = 1
+        self.weight_sum = 0
+        self.value_sum = 0
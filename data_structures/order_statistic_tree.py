@@ -0,0 +1,175 @@
+""" Order Statistic Tree implemented on top of the AVL Tree.
+    Every node caches the size of its subtree together with the total weight
+    and total value of the items in it, so that rank and prefix queries only
+    need a single root-to-leaf descent.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import Callable, Iterator, TypeVar, Generic
+from data_structures.avl import AVLTree
+from data_structures.node import OrderStatisticTreeNode
+
+# generic types
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class OrderStatisticTree(AVLTree, Generic[K, I]):
+    """ AVL tree with subtree aggregates.
+
+        The weight and value of an item are given by the `weight` and `value`
+        functions, in the same way as the `key` argument of mergesort.
+        The aggregates are recomputed by update_node, which the AVL tree calls
+        on every node of the path changed by an insertion or deletion (including
+        the node that receives the successor on deletion) and on both nodes of
+        every rotation, so they are always up to date.
+    """
+
+    def __init__(self, weight: Callable[[I], float] = lambda item: 0,
+                 value: Callable[[I], float] = lambda item: 0) -> None:
+        """
+            Initialises an empty Order Statistic Tree
+            :complexity: O(1)
+        """
+        AVLTree.__init__(self)
+        self.weight = weight
+        self.value = value
+
+    def create_node(self, key: K, item: I) -> OrderStatisticTreeNode:
+        """
+            Creates a node for this tree holding the key and item.
+            :complexity: O(weight(item) + value(item))
+        """
+        current = OrderStatisticTreeNode(key, item)
+        current.weight_sum = self.weight(item)
+        current.value_sum = self.value(item)
+        return current
+
+    def update_node(self, current: OrderStatisticTreeNode) -> None:
+        """
+            Recompute the height, size, total weight and total value of current from its children.
+            :pre: the children of current are up to date
+            :complexity: O(weight(item) + value(item))
+        """
+        AVLTree.update_node(self, current)
+        size = 1
+        weight_sum = self.weight(current.item)
+        value_sum = self.value(current.item)
+        if current.left is not None:
+            size += current.left.size
+            weight_sum += current.left.weight_sum
+            value_sum += current.left.value_sum
+        if current.right is not None:
+            size += current.right.size
+            weight_sum += current.right.weight_sum
+            value_sum += current.right.value_sum
+        current.size = size
+        current.weight_sum = weight_sum
+        current.value_sum = value_sum
+
+    def total_weight(self) -> float:
+        """
+            Total weight of all the items in the tree.
+            :complexity: O(1)
+        """
+        return self.root.weight_sum if self.root is not None else 0
+
+    def total_value(self) -> float:
+        """
+            Total value of all the items in the tree.
+            :complexity: O(1)
+        """
+        return self.root.value_sum if self.root is not None else 0
+
+    def select(self, k: int) -> OrderStatisticTreeNode:
+        """
+            Get the node with the k-th smallest key, counting from 0.
+            :complexity: O(logN), where N is the number of nodes in the tree
+            :raises IndexError: if k is not between 0 and len(self) - 1
+        """
+        if k < 0 or k >= len(self):
+            raise IndexError('Rank out of range: {0}'.format(k))
+        current = self.root
+        while True:
+            left_size = current.left.size if current.left is not None else 0
+            if k < left_size:
+                current = current.left
+            elif k == left_size:
+                return current
+            else:
+                k -= left_size + 1
+                current = current.right
+
+    def rank(self, key: K) -> int:
+        """
+            Number of keys in the tree smaller than key, i.e. the rank key has
+            (or would have once inserted), counting from 0.
+            :complexity: O(logN * compK), where N is the number of nodes in the tree
+        """
+        rank = 0
+        current = self.root
+        while current is not None:
+            if key <= current.key:
+                current = current.left
+            else:
+                rank += (current.left.size if current.left is not None else 0) + 1
+                current = current.right
+        return rank
+
+    def iter_from(self, k: int) -> Iterator[OrderStatisticTreeNode]:
+        """
+            Iterate over the nodes in ascending key order, starting from the node with
+            the k-th smallest key (counting from 0).
+            :complexity: O(logN) to reach the k-th node, then O(1) amortised per node
+        """
+        # descend towards the k-th node, stacking the nodes still to be visited after it
+        stack = []
+        current = self.root
+        while current is not None:
+            left_size = current.left.size if current.left is not None else 0
+            if k <= left_size:
+                stack.append(current)
+                current = current.left
+            else:
+                k -= left_size + 1
+                current = current.right
+        while stack:
+            current = stack.pop()
+            yield current
+            current = current.right
+            while current is not None:
+                stack.append(current)
+                current = current.left
+
+    def prefix_value(self, budget: float) -> float:
+        """
+            Total value obtained by taking the items in ascending key order while the
+            weight budget lasts. Every item that fits in the remaining budget is taken
+            whole, the first one that does not is taken fractionally (in proportion to
+            the budget left), and nothing is taken once the budget runs out.
+            :complexity: O(logN * (weight(item) + value(item))), where N is the number of nodes in the tree
+        """
+        total = 0
+        current = self.root
+        while current is not None and budget > 0:
+            left = current.left
+            left_weight = left.weight_sum if left is not None else 0
+            if budget <= left_weight:
+                # the budget runs out within the left subtree
+                current = left
+                continue
+            # the whole left subtree is taken
+            if left is not None:
+                total += left.value_sum
+                budget -= left_weight
+            weight = self.weight(current.item)
+            if budget <= weight:
+                # the budget runs out at this item
+                return total + budget*self.value(current.item)/weight
+            total += self.value(current.item)
+            budget -= weight
+            current = current.right
+        return total
@@ -1,6 +1,15 @@
 """ Basic class implementation of an array of references for FIT units
 
-The code for the init function is a bit cryptic, so I explain it here in
+ArrayR keeps its references in a Python list that is allocated once, with
+length slots set to None, and never grows or shrinks afterwards, so it still
+behaves as a fixed-length array. Indexing the list is much cheaper than
+indexing a ctypes array: reading a slot of a ctypes array builds a new
+reference to the object through py_object, while a list hands back the
+reference it already holds.
+
+The original implementation, built on a ctypes array of py_object, is kept
+as CTypesArrayR for comparison (see benchmarks/bench_referential_array.py).
+The code for its init function is a bit cryptic, so I explain it here in
 detail. The instance variables holding the physical array is constructed
 using the ctypes library to create a py_object (an object that can hold
 a reference to any python object). Note that for each value of length we
@@ -11,18 +20,23 @@ space to hold the references.
 
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
-checked by self.array[index].
+checked by self.array[index] for both backends: an index outside of
+-length .. length-1 raises IndexError.
 """
+from __future__ import annotations
+
 __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for the rest"
 __docformat__ = 'reStructuredText'
 
 from ctypes import py_object
-from typing import TypeVar, Generic
+from typing import Iterable, Iterator, Sequence, TypeVar, Generic
 
 T = TypeVar('T')
 
 
 class ArrayR(Generic[T]):
+    __slots__ = ('array',)
+
     def __init__(self, length: int) -> None:
         """ Creates an array of references to objects of the given length
         :complexity: O(length) for best/worst case to initialise to None
@@ -30,8 +44,19 @@ class ArrayR(Generic[T]):
         """
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
-        self.array = (length * py_object)() # initialises the space
-        self.array[:] =  [None for _ in range(length)]
+        self.array = [None] * length
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], length: int = 0) -> ArrayR[T]:
+        """ Creates an array holding the items of iterable, in order, followed by None
+        up to the given length if it is longer than the number of items.
+        :complexity: O(max(N, length)), where N is the number of items
+        :pre: there is at least one item, or length > 0
+        """
+        items = list(iterable)
+        array = cls(max(len(items), length))
+        array.array[:len(items)] = items
+        return array
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -39,16 +64,84 @@ class ArrayR(Generic[T]):
         """
         return len(self.array)
 
-    def __getitem__(self, index: int) -> T:
-        """ Returns the object in position index.
-        :complexity: O(1)
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over all the objects of the array, including the None ones.
+        :complexity: O(1) per object
+        """
+        return iter(self.array)
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        """ Returns the object in position index, or a list of the objects
+        in the positions of the slice.
+        :complexity: O(1) for an index, O(k) for a slice of k positions
         :pre: index in between 0 and length - self.array[] checks it
         """
         return self.array[index]
 
     def __setitem__(self, index: int, value: T) -> None:
-        """ Sets the object in position index to value
+        """ Sets the object in position index to value. Slices are rejected, since
+        assigning a slice of a list can change its length (use set_slice instead).
         :complexity: O(1)
         :pre: index in between 0 and length - self.array[] checks it
+        :raises ValueError: if index is a slice
         """
+        if type(index) is slice:
+            raise ValueError("Cannot set a slice of an array, use set_slice.")
         self.array[index] = value
+
+    def set_slice(self, start: int, values: Sequence[T]) -> None:
+        """ Sets the objects from position start onwards to the items of values,
+        one item per position, so the length of the array does not change.
+        :complexity: O(k), where k is the number of items
+        :raises IndexError: if the items do not fit in the array from position start
+        """
+        if start < 0 or start + len(values) > len(self.array):
+            raise IndexError("Cannot set {0} objects in an array of length {1} from {2}.".format(
+                len(values), len(self.array), start))
+        self.array[start:start + len(values)] = values
+
+    def copy_into(self, dst: ArrayR[T], start: int = 0) -> None:
+        """ Copies all the objects of this array into dst, from position start onwards.
+        :complexity: O(length)
+        :raises IndexError: if the objects do not fit in dst from position start
+        """
+        if start < 0 or start + len(self.array) > len(dst.array):
+            raise IndexError("Cannot copy {0} objects into an array of length {1} from {2}.".format(
+                len(self.array), len(dst.array), start))
+        dst.array[start:start + len(self.array)] = self.array[:]
+
+    def fill(self, value: T, start: int = 0, end: int | None = None) -> None:
+        """ Sets every position from start up to (but excluding) end to value.
+        :complexity: O(end - start)
+        """
+        positions = len(range(*slice(start, end).indices(len(self.array))))
+        self.array[start:end] = [value] * positions
+
+    def resize(self, length: int) -> ArrayR[T]:
+        """ Creates an array of the given length with the objects of this one in the
+        same positions, dropping the last ones if it is shorter and ending with None
+        if it is longer.
+        :complexity: O(length)
+        :pre: length > 0
+        """
+        resized = self.__class__(length)
+        kept = min(length, len(self.array))
+        resized.array[:kept] = self.array[:kept]
+        return resized
+
+
+class CTypesArrayR(ArrayR[T]):
+    """ Array of references backed by a ctypes array of py_object, the original ArrayR.
+    It inherits the rest of the operations, which only rely on self.array. """
+
+    __slots__ = ()
+
+    def __init__(self, length: int) -> None:
+        """ Creates an array of references to objects of the given length
+        :complexity: O(length) for best/worst case to initialise to None
+        :pre: length > 0
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        self.array = (length * py_object)() # initialises the space
+        self.array[:] =  [None for _ in range(length)]
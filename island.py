@@ -33,13 +33,16 @@ ISLAND_NAMES = [
     "Whole Cake Island",
 ]
 
-@dataclass
+@dataclass(slots=True)
 class Island:
 
     name: str
     money: float
     marines: int
 
+    def copy(self) -> Island:
+        return Island(self.name, self.money, self.marines)
+
     @classmethod
     def random(cls):
         return Island(
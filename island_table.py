@@ -0,0 +1,127 @@
+from __future__ import annotations
+from array import array
+from typing import Iterable, Iterator
+from island import Island
+
+
+class IslandTable:
+    """
+    Compact store of many islands, with one column per field instead of one object per island:
+    the names in a list, the money in an array('d') and the marines in an array('q').
+    A row of the table is read and changed through an IslandRow, a light view that behaves like an Island.
+
+    Each island costs 16 bytes in the number columns (plus the reference to its name), against a
+    dataclass instance with a float and an int object for every Island. The number columns support the
+    buffer protocol, so they can be wrapped by numpy.frombuffer and scored column-wise without copying.
+    The navigators keep their own objects for every island (tree nodes, heap keys, dictionary entries), so they
+    take the islands of a table as Island instances (see to_islands) and the table only saves memory while the
+    islands are stored or scored column-wise outside of a navigator.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise an empty table.
+        :complexity: O(1)
+        """
+        self.names: list[str] = []
+        self.money = array('d')
+        self.marines = array('q')
+
+    @classmethod
+    def from_islands(cls, islands: Iterable[Island]) -> IslandTable:
+        """
+        Table holding a copy of the given islands, in the same order.
+        :complexity: O(N), where N is the number of islands
+        """
+        table = cls()
+        for island in islands:
+            table.append(island.name, island.money, island.marines)
+        return table
+
+    def to_islands(self) -> list[Island]:
+        """
+        The islands of the table as Island instances, in row order.
+        :complexity: O(N), where N is the number of islands
+        """
+        return [Island(name, money, marines) for name, money, marines in zip(self.names, self.money, self.marines)]
+
+    def append(self, name: str, money: float, marines: int) -> None:
+        """
+        Add an island as the last row of the table.
+        :complexity: O(1) amortised
+        """
+        self.names.append(name)
+        self.money.append(money)
+        self.marines.append(marines)
+
+    def __len__(self) -> int:
+        """
+        Number of islands in the table.
+        :complexity: O(1)
+        """
+        return len(self.names)
+
+    def __getitem__(self, row: int) -> IslandRow:
+        """
+        View of the island in the given row.
+        :complexity: O(1)
+        :raises IndexError: if row is out of range
+        """
+        if row < 0:
+            row += len(self.names)
+        if not 0 <= row < len(self.names):
+            raise IndexError('Row out of range: {0}'.format(row))
+        return IslandRow(self, row)
+
+    def __iter__(self) -> Iterator[IslandRow]:
+        """
+        Views of all the islands, in row order.
+        :complexity: O(1) per row
+        """
+        for row in range(len(self.names)):
+            yield IslandRow(self, row)
+
+
+class IslandRow:
+    """
+    View of one row of an IslandTable, with the name, money and marines of the island as attributes.
+    Changing money or marines changes the table. It compares equal to an Island (or another row) with
+    the same fields, and copy returns the island as an Island.
+    """
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table: IslandTable, row: int) -> None:
+        self.table = table
+        self.row = row
+
+    @property
+    def name(self) -> str:
+        return self.table.names[self.row]
+
+    @property
+    def money(self) -> float:
+        return self.table.money[self.row]
+
+    @money.setter
+    def money(self, money: float) -> None:
+        self.table.money[self.row] = money
+
+    @property
+    def marines(self) -> int:
+        return self.table.marines[self.row]
+
+    @marines.setter
+    def marines(self, marines: int) -> None:
+        self.table.marines[self.row] = marines
+
+    def copy(self) -> Island:
+        return Island(self.name, self.money, self.marines)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (Island, IslandRow)):
+            return NotImplemented
+        return (self.name, self.money, self.marines) == (other.name, other.money, other.marines)
+
+    def __repr__(self) -> str:
+        return 'IslandRow(name={0!r}, money={1!r}, marines={2!r})'.format(self.name, self.money, self.marines)
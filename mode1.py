@@ -1,46 +1,77 @@
 from __future__ import annotations
 from island import Island
-from data_structures.bst import BinarySearchTree
+from data_structures.order_statistic_tree import OrderStatisticTree
+from algorithms.mergesort import merge, mergesort
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is optional, crew numbers are then answered with bst_store
+    np = None
 
 class Mode1Navigator:
     """
-    The data structures used for this class is BinarySearchTree. 
-    The depth of BST is assumed to be bounded by logN, where N is the number of nodes for this class.
+    The data structures used for this class is OrderStatisticTree, a self-balancing BinarySearchTree (AVL tree) where every
+    node also keeps the number of islands, the total marines and the total money of its subtree.
+    The depth of the tree is bounded by logN, where N is the number of nodes for this class, even when the islands arrive
+    sorted by their marine-money ratio.
     Strategy: 
         __init__ method:
             1. Initialise the crew number
-            2. Add all the island into the BST named 'bst_store' with key as marine-money ratio and item as the island itself
-            Note that this is viable due to the assumption that every island has different marine-money ratio. Also, the lower
-            marine-money ratio of the island, the higher the amount of money can be looted at the island given the same amount 
+            2. Build the tree named 'bst_store' in one go from the (key, island) pairs of all the islands,
+               using OrderStatisticTree.from_items: the pairs are sorted once with mergesort and the tree is built perfectly
+               balanced. The marines of an island are used as its weight and the money as its value.
+            The key of an island is the pair (marine-money ratio, island name), see island_key. Islands are ordered by their
+            marine-money ratio first, and islands with the same ratio are told apart by their (unique) names, so any number of
+            islands can share the same ratio. Also, the lower marine-money ratio of the island, the higher the amount of money can be looted at the island given the same amount 
             of crew. Thus for the following method, while assigning crew members to each island, priority is given to the island
             with lower marine-money ratio.
         select_islands method:
-            1. Use a for loop to perform inorder traversal for the bst_store (Note that the default iterator given in the bst class
-            iterate through the bst with inorder manner: left subtree, current node, right subtree) Inorder traversal will traverse through
-            all the island which is stored in the bst_store according to their marine-money ratio in ascending order
-            2. In the for loop, extract the information (marine numbers) of current island given by bst_store iterator.
-            3. Allocate crew to the island according to the marine numbers and crew available.
-            4. Append the tuple pair of island and crew number allocated into the final return list named 'island_crew_l'
-            5. Repeat the process until the for loop ends.
+            1. Make sure the crew index is up to date (see below).
+            2. The crew index already holds the allocation, i.e. the (island, crew) pair of every island in ascending
+               marine-money ratio, so a copy of it is returned. Each island is sent as many crew as its marines while
+               there is crew available; the island where the crew runs out gets whatever crew is left and every island
+               after it gets 0 crew.
         select_islands_from_crew_numbers method:
-            1. Use a for loop to loop through all the crew number given in the 'crew_numbers' list
-            2. For a single crew number, start by creating a variable named 'money_looted' to store the amount of money pirated
-               by the crew.
-            3. Use a for loop perform inorder traversal for bst_store and for extract informations(money and marine) for each island
-               stored within. Compute and accumulate the amount of money pirated while sending crew to each island. Stop the iteration
-               pirated through all the island or there is no more crew to be sent to pirate the island.
-            4. Store the amount of money pirated into the return list named 'pirated_money_l'.
-            5. Repeat the process for all the crew number in the crew_numbers list
+            1. For a single crew number, descend bst_store from the root using prefix_value. At every node, if the crew
+               runs out within the left subtree, go left. Otherwise the whole left subtree is looted (its money total is
+               cached in the node), then the island of the node is looted fully or, if the crew runs out there, partially,
+               and the descent continues to the right with the crew left.
+            2. Store the amount of money pirated into the return list named 'pirated_money_l'.
+            3. Repeat the process for all the crew number in the crew_numbers list
+            When NumPy is installed and there are many crew numbers (at least N/VECTORISE_RATIO), all of them are instead
+            answered in one vectorised pass by a VectorisedCrewEngine, which is kept until the next update.
         update_island method:
-            Note that the marine-money ratio is used as key to store the island in the bst_store.
-            1. Compute the old key used to store the island in the bst_store.
-            2. Create a updated Island instance using the old_name of the island and the updated state
-               given as parameters.
+            Note that the (marine-money ratio, name) pair is used as key to store the island in the bst_store.
+            1. Look up the name of the island in 'name_index', a dictionary from island name to the key the island is
+               currently stored with in bst_store (see update_island_by_name). The key is not recomputed from the given
+               island, so an outdated copy of the island still updates the right island.
+            2. Create a updated Island instance using the name of the island and the updated state given as parameters.
             3. Compute the updated key used to store the island in the bst_store using the new_money and new_marines.
             4. Delete the outdated island from the bst_store using old key
-            5. Add the updated island into the bst_store using the updated key.
+            5. Add the updated island into the bst_store using the updated key, and store the updated key in 'name_index'.
+               The subtree totals of bst_store are kept up to date by the deletion and insertion themselves.
+            6. Mark the crew index as outdated from the smaller of the old and new rank of the island in bst_store
+               onwards.
+        update_islands method:
+            1. If the batch is small compared to the number of islands, call update_island_by_name for every update.
+            2. Otherwise, create the updated islands (keeping the last update of every island), sort them by key with
+               mergesort and merge them with the islands of bst_store that are not updated, read in ascending key order. bst_store is then rebuilt once from the merged pairs with from_sorted_items, and the
+               whole crew index is marked as outdated.
+        crew index:
+            The crew index is a pair of lists indexed by the rank of the islands in bst_store (their position in ascending
+            marine-money ratio) used by select_islands: 'cum_marines' (running total of marines up to and including each
+            island) and 'allocation' (the result of select_islands). They only go out of date from the first rank changed by
+            update_island, which is stored in 'outdated_from'. Everything before that rank depends only on the islands before
+            it, so refresh_crew_index only recomputes the suffix starting at 'outdated_from', reading the islands from bst_store
+            in order from that rank, and does nothing when no island changed since the last query.
     """
 
+    # update_islands rebuilds bst_store once the batch has at least 1/BATCH_REBUILD_RATIO updates per island,
+    # below that the O(logN) updates one at a time are faster (see benchmarks/bench_mode1_updates.py)
+    BATCH_REBUILD_RATIO = 5
+    # select_islands_from_crew_numbers builds a VectorisedCrewEngine for at least N/VECTORISE_RATIO crew numbers
+    VECTORISE_RATIO = 2
+
     def __init__(self, islands: list[Island], crew: int) -> None:
         """
         Initialise the Nove1Navigator class with initial state of islands and number of crew
@@ -50,56 +81,90 @@ class Mode1Navigator:
             : islands: number of islands on the sea to be navitaged
             : crew: number of crew that is taken on the journey
 
-        :complexity: O(NlogN), where N is the number of island in the argument list named 'islands'
+        :complexity best: O(N), where N is the number of island in the argument list named 'islands', when the islands
+                          are already given in ascending marine-money ratio
+        :complexity worst: O(NlogN), when the islands need to be sorted
 
         :further explanation: 
-            The complexity of the __init__ method depends on the for loop block when island is added into the Binary Search Tree named 'bst_store'.
-            In details, __setitem__ method for BST has complexity of O(logN*compK), where N is the number of nodes in the BST and in this method
-            can be interpreted as number of island and compK is the comparison costs for the key of the node which has O(1) complexity in this case 
-            since the key is money-marine ratio which is a float, giving __setitem__ a final complexity of O(logN).
-            The for loop itself is repeated for N times, thus resulting in O(NlogN) time complexity. All other operations in this method which
-            involve assignment and initialisation of BST has O(1) complexity. Thus the overall dominating complexity is O(NlogN) for both best case and worst case. 
+            The complexity of the __init__ method depends on OrderStatisticTree.from_items, which builds the tree named 'bst_store'
+            out of the (key, island) pairs. Computing the pairs is O(N). from_items first checks if the pairs are sorted in O(N), and
+            if they are not, sorts them with mergesort, which is O(NlogN*compK), where compK is the comparison cost of the keys. The
+            keys are (float, name) pairs, and the names are only compared when two islands have the same ratio, so compK is O(1)
+            (island names are assumed to be short). The balanced tree is then built from the sorted pairs by creating every node
+            exactly once and computing its subtree totals from its children, which is O(N). Unlike adding the islands one by one,
+            the shape of the tree does not depend on the order of the islands. Thus the complexity is O(N) in the best case and
+            O(NlogN) in the worst case.
         """
         self.crew_num = crew
         self.num_islands = len(islands)
-         # Create a BST 'bst_store' to store all the islands with key as the marine-money ratio
-        self.bst_store = BinarySearchTree()
-        # Add all islands into bst_store with key as marine-money ratio of the island value as the island itself
-        # O(NlogN) -> depth of BST is bounded by logN, where N is the number of islands
-        for island in islands:  
-            marine_money_r = island.marines/island.money    # compute marine-money ratio
-            self.bst_store[marine_money_r] = island # setitem in BST has complexity O(logN), given the depth is bounded by logN
+        # Create a tree 'bst_store' to store all the islands with key as the (marine-money ratio, name) pair of the island
+        # and value as the island itself, keeping the total marines and money of every subtree
+        key_island_pairs = [(island_key(island.name, island.money, island.marines), island) for island in islands]   # O(N)
+        self.bst_store = OrderStatisticTree.from_items(key_island_pairs, weight=island_marines, value=island_money)  # O(NlogN)
+        # index from the name of every island to the key it is stored with in bst_store, O(N)
+        self.name_index: dict[str, tuple[float, str]] = {key[1]: key for key, _ in key_island_pairs}
+        # crew index by rank in bst_store, the running totals and allocation are computed lazily on the first query
+        self.cum_marines: list[int] = [0] * self.num_islands
+        self.allocation: list[tuple[Island, int]] = [None] * self.num_islands
+        self.outdated_from = 0
+        # NumPy engine for crew numbers, built on demand and dropped on every update
+        self.crew_engine: VectorisedCrewEngine | None = None
+
+    def refresh_crew_index(self) -> None:
+        """
+        Recompute the running total of marines and the crew allocated to each island, for every position
+        of the crew index from 'outdated_from' onwards.
+
+        :complexity best: O(1), when no island was updated since the last refresh
+        :complexity worst: O(N), where N is the number of islands in bst_store, when the island with the lowest
+                           marine-money ratio was updated
+
+        :further explanation:
+            The values at position i only depend on the islands at positions 0 to i, so the values before 'outdated_from'
+            are still correct and the running totals carry on from position 'outdated_from'-1. The islands from rank
+            'outdated_from' onwards are read with iter_from of bst_store, which reaches that rank in O(logN) and then walks
+            the tree in order in O(1) amortised per island. Every position recomputed only involves additions, comparisons
+            and assignments which are O(1) operations, thus the complexity is O(logN + N-P) where P is 'outdated_from'.
+        """
+        start = self.outdated_from
+        if start == self.num_islands:
+            return
+        marines_total = self.cum_marines[start-1] if start > 0 else 0
+        for i, node in enumerate(self.bst_store.iter_from(start), start):
+            tar_island: Island = node.item
+            crew_require = tar_island.marines   # crew required to get all the money on the island
+            crew_available = self.crew_num - marines_total
+            # has enough crew to get all the money on the island
+            if crew_available > crew_require:
+                self.allocation[i] = (tar_island, crew_require)
+            # crew available is just enough or not enough to pirate all the money on the island
+            elif crew_available > 0:
+                self.allocation[i] = (tar_island, crew_available)
+            # no more crew available
+            else:
+                self.allocation[i] = (tar_island, 0)
+            marines_total += crew_require
+            self.cum_marines[i] = marines_total
+        self.outdated_from = self.num_islands
 
     def select_islands(self) -> list[tuple[Island, int]]:
         """
         Select the islands that we wish to attack and returning a list containing pairs, with each pair
         containing the island itself together with the number of crew that will be sent to each island
 
-        :complexity: O(N), where N is the number of island stored in the bst_store
+        :complexity best: O(N), where N is the number of island stored in the bst_store, to copy the cached allocation
+        :complexity worst: O(N), when the crew index has to be refreshed first
 
         :further explanation: 
+            The allocation is cached in the crew index and only the suffix outdated by update_island is recomputed by
+            refresh_crew_index, which is at most O(N). Returning a copy of the allocation, so that the caller cannot modify
+            the cache, is O(N) but is a single list copy instead of a traversal of bst_store.
         """
         # while sending crewmates, island with lower marine-money ratio will be given priority to maximise the 
-        # money make, thus in order traversal is used to traserve the bst_store in ascending order.
-        crew_available = self.crew_num
-        island_crew_l = []
-        for ratio_island_pair in self.bst_store: # loop through all the node, O(N)
-            tar_island: Island = ratio_island_pair.item   # O(1), extract item from the bst node
-            crew_require = tar_island.marines   # compute the crew required to get all the money on the island
-            # has enough crew to get all the money on the island 
-            if crew_available > crew_require:
-                island_crew_l.append((tar_island, crew_require))  # append method of a list has O(1) complexity 
-                crew_available -= crew_require
-            # no more crew available
-            elif crew_available == 0:
-                island_crew_l.append((tar_island, 0))
-            # crew available is just enough or not enough to pirate all the money on the island
-            elif crew_available <= crew_require:
-                island_crew_l.append((tar_island, crew_available))
-                crew_available = 0
-        return island_crew_l
-    
-        
+        # money make, which is the order the allocation is stored in the crew index.
+        self.refresh_crew_index()
+        return list(self.allocation)
+
     def select_islands_from_crew_numbers(self, crew_numbers: list[int]) -> list[float]:
         """
         Calculate the most money that can be made with different crew combinations and return a
@@ -108,67 +173,207 @@ class Mode1Navigator:
         :param_args:
             crew_numbers: a list of crew number that is used to calculate the most money made if the amount is sent to pirate the islands
 
-        :complexity: O(C*N), where C is the length of crew_numbers list and N is the number of islands in bst_store (created during initialisation)
+        :complexity: O(C*logN), where C is the length of crew_numbers list and N is the number of islands in bst_store
 
         :further explanation: 
-            The complexity of this method is governed by the nested for loop block. At the first layer of the nested for loop, all
-            crew number given in the crew_numbers list is looped through to compute the maximum money pirated by the corresponding crew
-            number. And within the first layer loop, there is a second layer loop to traverse through the bst_store to compute the amount
-            of money that can be pirated from each islands. Within the second layer for loop, all the code has O(1) complexity since they
-            only involve comparison of numbers, arithmetic operations and simple assignments. Thus, the final complexity of this method is 
-            O(C*N), where C is the length of crew_numbers list and N is the number of islands given in 'islands' list during initialisation
-            for both best case and worst case.
+            Every crew number is answered by prefix_value of bst_store, which walks a single path from the root down to at most
+            a leaf. Every node on the path only involves comparisons, arithmetic operations and reading the totals cached in the
+            node, which are O(1). Since the depth of bst_store is bounded by logN, every crew number costs O(logN) and the whole
+            list of crew numbers costs O(C*logN). The cached totals are kept up to date by update_island, so no extra rebuilding
+            is needed between updates and queries.
+            With NumPy, the crew numbers are answered by VectorisedCrewEngine.select, which is also O(C*logN) but runs the loop
+            over the crew numbers inside NumPy. The engine costs O(N) to build and has a large constant per
+            query, so it is only built when C*VECTORISE_RATIO >= N (it only wins from about C = N/4).
         """
+        if np is not None and (self.crew_engine is not None or len(crew_numbers) * self.VECTORISE_RATIO >= self.num_islands):
+            if self.crew_engine is None:
+                self.crew_engine = self.build_crew_engine()     # O(N)
+            return self.crew_engine.select(crew_numbers)     # O(C*logN)
         pirated_money_l = []
         for crew_num in crew_numbers: # loop through different crew number in argument list 'crew_numbers' 
-            money_looted = 0  
-            crew_available = crew_num
-            for ratio_island_pair in self.bst_store:
-                tar_island: Island = ratio_island_pair.item
-                money = tar_island.money
-                marine = tar_island.marines
-                crew_require = tar_island.marines
-                # manage to loot all the money on the islands
-                if crew_available > crew_require:
-                    money_looted += money
-                    crew_available -= crew_require
-                # no more crew available to loot money on islands remaining, break the loop
-                elif crew_available == 0:
-                    break
-                # crew available is not enough to loot all the money on the island
-                elif crew_available <= crew_require:
-                    money_looted += crew_available*money/marine
-                    crew_available = 0
+            money_looted = self.bst_store.prefix_value(crew_num)  # O(logN)
             pirated_money_l.append(money_looted)    # append for list give O(1) complexity
         return pirated_money_l     
 
 
+    def build_crew_engine(self) -> VectorisedCrewEngine:
+        """
+        VectorisedCrewEngine of the islands currently in bst_store.
+        :complexity: O(N), where N is the number of islands in bst_store
+        """
+        return VectorisedCrewEngine([node.item for node in self.bst_store])
+
     def update_island(self, island: Island, new_money: float, new_marines: int) -> None:
         """
         Update the money or marine value of an island
 
         param args:
-            island: Island instance to be updated
+            island: Island instance to be updated, only its name is used to find the island
+            new_money: value of money after updated
+            new_marines: value of marines after updated
+
+        complexity: see update_island_by_name
+        :raises KeyError: if there is no island with the name of the given island
+        """
+        self.update_island_by_name(island.name, new_money, new_marines)
+
+    def update_island_by_name(self, name: str, new_money: float, new_marines: int) -> None:
+        """
+        Update the money or marine value of the island with the given name
+
+        param args:
+            name: name of the island to be updated
             new_money: value of money after updated
             new_marines: value of marines after updated
 
         complexity: 
-            O(log(N)), where N is the number of island in the bst_store (created during initialisation)
+            O(log(N)) comparisons, where N is the number of island in the bst_store (created during initialisation)
+
+        :raises KeyError: if there is no island with the given name
 
         :further explanation:
-            In this method, the complexity is governed by both __setitem__ and __delitem__ method of bst_store, 
-            which have O(logN*compK), where N is the number of islands stored in the bst using marine-money ratio, 
-            and compK is the comparison cost of the key which in this case, is O(1) since the keys (marine-money ratio)
-            are float. All other codes has O(1) which involve arithmetic operations, simple assignment and createion of 
-            new Island instance has complexity O(1). Thus the final complexity is O(constant + logN + logN) = O(2logN) = O(logN)
-            for both best case and worst case. 
-        """
-        old_key = island.marines/island.money   
-        old_name = island.name
-        updated_island:Island = Island(old_name, new_money, new_marines)    # O(1): create an updated instance of island
-        updated_key = new_marines/new_money # create an updated key of the updated island in the bst_store
+            The key the island is currently stored with is read from 'name_index', which is a python in-built dictionary
+            with O(1) lookup, instead of being recomputed from the island. The complexity is then governed by both
+            __setitem__ and __delitem__ method of bst_store, which have O(logN*compK), where N is the number of islands
+            stored in the bst using marine-money ratio, and compK is the comparison cost of the key which in this case,
+            is O(1) since the keys are (marine-money ratio, name) pairs whose names are only compared for islands with the
+            same ratio. Since the name is part of the key, only the named island is deleted even when other islands have
+            the same ratio. All other codes has O(1) which involve arithmetic operations, simple assignment and createion of 
+            new Island instance has complexity O(1). The old and new rank of the island, which are its positions in the
+            crew index, are each found with rank of bst_store, a single descent that adds up the cached subtree sizes,
+            O(logN). Nothing is moved in the crew index, the positions from the smaller rank onwards are only marked as
+            outdated. Thus the final complexity is O(constant + 4logN) = O(logN) for both best case and worst case.
+        """
+        old_key = self.name_index[name]     # O(1), raises KeyError for unknown names
+        updated_key = island_key(name, new_money, new_marines) # create an updated key of the updated island in the bst_store
+        old_pos = self.bst_store.rank(old_key)  # O(logN)
+        updated_island:Island = Island(name, new_money, new_marines)    # O(1): create an updated instance of island
         del self.bst_store[old_key] # O(logN)
         self.bst_store[updated_key] = updated_island   # O(logN)
+        new_pos = self.bst_store.rank(updated_key)  # O(logN)
+        self.name_index[name] = updated_key
+        self.crew_engine = None
+        # everything in the crew index from the first changed rank onwards is outdated
+        self.outdated_from = min(self.outdated_from, old_pos, new_pos)
+
+    def update_islands(self, batch: list[tuple[str, float, int]]) -> None:
+        """
+        Apply a batch of updates, each given as (name, new_money, new_marines), in order.
+
+        param args:
+            batch: list of updates, an island can be updated more than once and its last update is kept
+
+        complexity:
+            O(B*log(N)) when B*BATCH_REBUILD_RATIO < N, where B is the length of batch and N is the number of islands,
+            O(N + B*log(B)) otherwise
+
+        :raises KeyError: if there is no island with one of the names, in which case no update is applied
+
+        :further explanation:
+            Checking the names first is O(B) since 'name_index' is a python in-built dictionary. A small batch is applied
+            one update at a time, and every update_island_by_name is O(logN). For a large batch, creating the updated islands
+            is O(B), and sorting them with mergesort is O(B*logB). The islands that are not updated are read from bst_store
+            in order, which is already sorted, in O(N), and the two sorted lists are merged in O(N+B). Building the balanced
+            tree from the merged pairs is O(N). Thus the rebuild is O(N + B*logB), which is cheaper
+            than B*logN tree updates once the batch is a sizeable fraction of the islands: measured at N=10^5, the
+            rebuild only wins from about N/6 updates, hence BATCH_REBUILD_RATIO.
+        """
+        for name, _, _ in batch:
+            if name not in self.name_index:
+                raise KeyError(name)
+        if len(batch) * self.BATCH_REBUILD_RATIO < self.num_islands:
+            for name, new_money, new_marines in batch:
+                self.update_island_by_name(name, new_money, new_marines)   # O(logN)
+            return
+
+        # last updated state of every island in the batch
+        updated_islands: dict[str, Island] = {}
+        for name, new_money, new_marines in batch:
+            updated_islands[name] = Island(name, new_money, new_marines)
+        updated_pairs = [(island_key(island.name, island.money, island.marines), island) for island in updated_islands.values()]
+        updated_pairs = mergesort(updated_pairs, key=lambda pair: pair[0])    # O(BlogB)
+        # islands that are not updated, already in ascending key order
+        kept_pairs = [(node.key, node.item) for node in self.bst_store
+                      if node.key[1] not in updated_islands]    # O(N)
+        key_island_pairs = merge(kept_pairs, updated_pairs, key=lambda pair: pair[0])    # O(N+B)
+        self.bst_store = OrderStatisticTree.from_sorted_items(key_island_pairs, weight=island_marines, value=island_money)
+        for key, island in updated_pairs:
+            self.name_index[island.name] = key
+        self.outdated_from = 0
+        self.crew_engine = None
+
+
+class VectorisedCrewEngine:
+    """
+    NumPy arrays of the money and marines of the islands in ascending marine-money ratio, with their running totals,
+    used to answer many crew numbers at once. The engine does not follow updates of the islands, so it has to be
+    created again after they change.
+    """
+
+    def __init__(self, ratio_islands: list[Island]) -> None:
+        """
+        :param args:
+            ratio_islands: the islands in ascending marine-money ratio
+        :complexity: O(N), where N is the length of ratio_islands
+        """
+        self.money = np.fromiter((island.money for island in ratio_islands), dtype=np.float64, count=len(ratio_islands))
+        self.marines = np.fromiter((island.marines for island in ratio_islands), dtype=np.int64, count=len(ratio_islands))
+        self.cum_money = np.cumsum(self.money)
+        self.cum_marines = np.cumsum(self.marines)
+
+    def select(self, crew_numbers: list[int]) -> list[float]:
+        """
+        Compute the money looted with every crew number, as Mode1Navigator.select_islands_from_crew_numbers does.
+
+        :complexity: O(C*logN), where C is the length of crew_numbers and N is the number of islands
+
+        :further explanation:
+            np.searchsorted finds, for every crew number at once, the first island where the running total of marines
+            reaches the crew number (O(logN) each). The islands before it are fully looted, so their money is the running
+            total of money just before it, and the crew left partially loots that island. Crew numbers that are large enough
+            to loot every island get the total money, and crew numbers of 0 or less get 0.
+        """
+        crews = np.asarray(crew_numbers, dtype=np.float64)
+        n = len(self.marines)
+        if n == 0:
+            return np.zeros(len(crews)).tolist()
+        idx = np.searchsorted(self.cum_marines, crews, side='left')
+        safe_idx = np.minimum(idx, n - 1)
+        prev_idx = np.maximum(safe_idx - 1, 0)
+        has_prev = safe_idx > 0
+        marines_before = np.where(has_prev, self.cum_marines[prev_idx], 0)
+        money_before = np.where(has_prev, self.cum_money[prev_idx], 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            partial = (crews - marines_before) * self.money[safe_idx] / self.marines[safe_idx]
+        money_looted = np.where(idx >= n, self.cum_money[-1], money_before + partial)
+        money_looted = np.where(crews <= 0, 0.0, money_looted)
+        return money_looted.tolist()
+
+
+def island_key(name: str, money: float, marines: int) -> tuple[float, str]:
+    """
+    Key of an island in bst_store: the marine-money ratio, with the name of the island to tell apart
+    islands that have the same ratio.
+    :complexity: O(1)
+    """
+    return (marines/money, name)
+
+
+def island_marines(island: Island) -> int:
+    """
+    Weight of an island in bst_store, which is the crew needed to loot all of its money.
+    :complexity: O(1)
+    """
+    return island.marines
+
+
+def island_money(island: Island) -> float:
+    """
+    Value of an island in bst_store, which is the money that can be looted on it.
+    :complexity: O(1)
+    """
+    return island.money
+
 
 if __name__ == "__main__":
     a = Island("A", 400, 100)
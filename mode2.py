@@ -1,30 +1,69 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
 from island import Island
-from data_structures.heap import MaxHeap
+from data_structures.heap import MaxHeap, MinHeap
+from data_structures.indexed_heap import IndexedMaxHeap
 
 class Mode2Navigator:
     """
-    The data structure used for this class is in-built dictionary and MaxHeap
+    The data structure used for this class is in-built dictionary, CrewScoreIndex and IndexedMaxHeap
+
+    By default every day is simulated on its own: the islands worth plundering (money-marine ratio > 2) are scored
+    for the crew size of the day into a score heap, and nothing is kept for the next day. When there are many more
+    islands worth plundering than pirates (more than TOP_K_RATIO times), the score heap only holds the keys of the
+    n_pirates best islands, found with a bounded MinHeap (see top_keys), so that it takes O(P) memory instead of O(N).
+    The pirates of a day visit at most n_pirates different islands, and each of them is the best island not visited
+    yet when a pirate first goes there, so these islands are always among the n_pirates best ones.
+
+    With keep_index set, the islands worth plundering are instead kept in a CrewScoreIndex between days. The index splits
+    them at the crew size into the islands a pirate loots completely and the ones it plunders partially, and orders
+    each group by a value that does not depend on the crew size, so that the best island for any crew size is found
+    at the top of one of the two groups without scoring every island. When the crew size changes, only the islands
+    whose marines lie between the old and the new crew size move to the other group.
+    During a day, the islands are taken out of the index in descending score order as the pirates need them, into a
+    small score heap of the day, and the ones that are still worth plundering go back into the index at the end of
+    the day. Islands should only be changed through add_islands and simulate_day, so that the index stays in line
+    with island_dict. The index takes O(N) memory for the whole life of the navigator, in exchange for days that
+    do not score every island again.
+
+    By default every plunder creates a new Island for the plundered island, which is returned in the results and
+    replaces the old one in island_dict. With in_place set, the Island instances given to add_islands are changed
+    in place instead, the results only hold the island name, and snapshot returns a copy of the islands on request.
     """
 
-    def __init__(self, n_pirates: int) -> None:
+    # number of children of every node of the heaps of the score index and of the day, see DaryMaxHeap
+    HEAP_ARITY = 4
+    # without the score index, the score heap only keeps the best n_pirates islands when there are more than
+    # TOP_K_RATIO*n_pirates islands worth plundering
+    TOP_K_RATIO = 8
+
+    def __init__(self, n_pirates: int, in_place: bool = False, keep_index: bool = False) -> None:
         """
         Initialise the Mode2 NaviGator Class
 
         :param args:
             n_pirates: number of pirates involved in the Davy Back Fight
-        
+            in_place: change the islands in place and return (name, crew) records from simulate_day
+            keep_index: keep the islands worth plundering in a CrewScoreIndex from one day to the next
+
         :complexity: O(1)
 
-        :further explanation: 
+        :further explanation:
             The initialisation method has constant time complexity because it only involve
             constant time operations which is simple assignment and creation of a dictionary.
         """
         self.n_pirates = n_pirates
+        self.in_place = in_place
+        self.keep_index = keep_index
         # Create a dictionary to store the island on the sea using the island name as the key
         self.island_dict: dict[str,Island] = {}
-        
+        # names of the islands with money-marine ratio greater than 2
+        self.worth_names: set[str] = set()
+        # index of the islands worth plundering kept between days with keep_index, built on the first day
+        self.score_index: CrewScoreIndex | None = None
+
     def add_islands(self, islands: list[Island]):
         """
         Add islands to the seas.
@@ -32,98 +71,536 @@ class Mode2Navigator:
         :param args:
             islands: a list of Island instances to be added to the sea
 
-        :complexity: O(I) where I is the length of 'islands' list 
+        :complexity: O(I) where I is the length of 'islands' list, O(I*logN) when the score index is kept,
+                     where N is the number of islands in the score index
 
         :further explanation:
             This method simply loop through the 'islands' list and add all the Island instance
             in the list to the instance variable self.island_dict dictionary. __setitem__ method
             in python in-built dictionary is assumed to have complexity of O(1), thus the complexity
             of this method depends simply on the number of island in the parameter arguments 'islands' list.
+            If the score index is kept from a previous day, every added island is also removed
+            from and/or added to the index, which is O(logN) each.
         """
         for island in islands:
             self.island_dict[island.name] = island
+            if is_worth_plundering(island):
+                self.worth_names.add(island.name)
+            else:
+                self.worth_names.discard(island.name)
+            if self.score_index is not None:
+                if island.name in self.score_index:
+                    self.score_index.remove(island.name)     # O(logN)
+                if island.name in self.worth_names:
+                    self.score_index.add(island)    # O(logN)
+
+    def snapshot(self) -> dict[str, Island]:
+        """
+        Copy of the current state of every island on the sea, by island name.
+
+        :complexity: O(N), where N is the number of islands
+        """
+        snapshot = {}
+        for island_name, island in self.island_dict.items():
+            snapshot[island_name] = island.copy()
+        return snapshot
 
-    def simulate_day(self, crew: int) -> list[tuple[Island|None, int]]:
+    def simulate_days(self, crews: Iterable[int]) -> Iterator[list[tuple[Island|None, int]]]:
+        """
+        Simulate one day of Davy Back Fight for every crew size in crews, in order, and yield the
+        result of each day as soon as it is simulated, in the same format as simulate_day.
+
+        :param args:
+            crews: Size of the crew for every pirate captain, for each day
+
+        :complexity: see simulate_day
+
+        :further explanation:
+            The score index and the set of islands worth plundering are kept from one day to the next, so only the
+            islands plundered on a day, and the ones moved by a change of crew size, are placed in the index again
+            for the next day. Without keep_index, the index is only kept while the generator runs, and released
+            once it finishes or is closed. Since the results are yielded one day at a time, the results of a long
+            run do not need to be kept in memory together.
+        """
+        keep_index = self.keep_index
+        self.keep_index = True
+        try:
+            for crew in crews:
+                yield self.simulate_day(crew)
+        finally:
+            if not keep_index:
+                self.keep_index = False
+                self.score_index = None
+
+    def simulate_day(self, crew: int) -> list[tuple[Island|None, int]] | list[tuple[str|None, int]]:
         """
         Simulate a day of Davy Back Fight and return a list of tuples, representing
         the choices made by the first, second, ... captain in order. Each tuple contain the
-        island that was plundered and number of crews that were sent onto the island
+        island that was plundered and number of crews that were sent onto the island.
+        With in_place set, the tuples contain the name of the island instead, and the islands
+        in island_dict are changed in place.
 
-        :param args: 
+        :param args:
             crew: Size of the crew for every pirate captain
-        
+
+        :complexity: O(W*logP + P*logP), where W is the number of islands worth plundering and P the number of
+                     pirates, when W > TOP_K_RATIO*P, and O(W + P*logW) otherwise. With keep_index:
+        :complexity best: O(P + K*logN), where N is the number of islands and K is the
+                          number of islands taken out of the score index today (the ones plundered, and the ones with
+                          the same score as one of them), when the crew size is the same as on the previous day
+        :complexity worst: O(P + (C+K)*logN), when the crew size changed and C islands move to the other group of
+                           the score index, or O(N + P + K*logN) on the first day, when the score index is built
+
+        :further explanation:
+            Without the score index, every island worth plundering is scored once, which is O(W). With many more islands
+            than pirates the keys go through a MinHeap holding the best P keys seen so far (see top_keys), and most keys
+            are dropped after one comparison with the smallest of them, so only O(P) keys are stored and heapified.
+            The score index gives the best score of the islands it holds in O(1) and the island with that score in
+            O(logN). The islands are only taken out of the index into the score heap of the day while the best score
+            in the index is not smaller than the top of the heap, so the heap always gives the best island overall,
+            and at most the islands plundered today (plus the ones with the same score) leave the index.
+            The choices of most pirates are already decided without going through the heap:
+            - Once the heap and the index are empty, every remaining pirate stays at home, so all of them are added at once.
+            - A pirate that only partially plunders an island leaves it with the same money-marine ratio, so
+              its new score is often still the highest. The runner-up score, the best of the children of the top
+              of the heap and of the index, is read once, and the following pirates plunder the same island for
+              as long as its score stays above the runner-up and it cannot be looted completely. The run only
+              repeats the arithmetic on the money and marines of the island, O(1) per pirate, and the new key of
+              the island then replaces the top of the heap with a single replace_top.
+            The pirates still take the exact same choices, in the same order, as if every one of them went
+            through one heap of all the islands.
+
         :best case: happens when all the island has mmratio <= 2
         :worst case: happens when all the island has mmratio > 2
         """
+        # The score heap and index only hold the islands that have money-marine ratio greater than 2
+        # If money-marine ratio <= 2, no plundering will result in higher score, thus whenever an island have money-marine ratio <= 2,
+        # it is not stored into the score heap or index.
+        if not self.keep_index:
+            return self.plunder(self.day_score_heap(crew), crew, None)
+        if self.score_index is None:
+            self.score_index = CrewScoreIndex.build(crew, self.island_dict, self.worth_names, self.HEAP_ARITY)   # O(N)
+        else:
+            self.score_index.set_crew(crew)     # O(C*logN)
+        return self.plunder(IndexedMaxHeap(1, key=heap_key_name, arity=self.HEAP_ARITY), crew, self.score_index)
+
+    def day_score_heap(self, crew: int) -> IndexedMaxHeap[HeapKey]:
+        """
+        Score heap of a day simulated on its own: the keys of the islands worth plundering for the given crew
+        size, or only of the n_pirates best ones when there are more than TOP_K_RATIO*n_pirates of them.
+
+        :complexity: O(W) when W <= TOP_K_RATIO*P, where W is the number of islands worth plundering and P the number
+                     of pirates, O(W*logP) otherwise
+        """
+        keys = (score_key(self.island_dict[island_name], crew) for island_name in self.worth_names)
+        if len(self.worth_names) > self.TOP_K_RATIO*self.n_pirates:
+            keys = top_keys(keys, self.n_pirates)   # O(W*logP), O(P) memory
+        else:
+            keys = list(keys)   # O(W)
+        return IndexedMaxHeap.heapify(keys, key=heap_key_name, arity=self.HEAP_ARITY)
+
+    def simulate_day_sharded(self, crew: int, n_workers: int,
+                             executor: Executor | None = None) -> list[tuple[Island|None, int]] | list[tuple[str|None, int]]:
+        """
+        Simulate a day of Davy Back Fight like simulate_day, scoring the islands in n_workers processes.
+        The results and the state of the islands afterwards are the same as with simulate_day.
+
+        :param args:
+            crew: Size of the crew for every pirate captain
+            n_workers: number of shards the islands are split into, scored in parallel
+            executor: process pool to score the shards with, a new ProcessPoolExecutor with n_workers
+                      processes is used for this call if not given
+
+        :complexity: O(W/S + P*logS + P + K*logP) for the scoring, merging and plundering, where W is the number of
+                     islands worth plundering and S the number of shards, plus O(W) to send the islands to the shards
+
+        :further explanation:
+            The pirates of a day can visit at most P different islands, and every pirate that goes to an island
+            not visited yet today takes the one with the highest score among them, so only the P islands with the
+            highest scores can be visited. Every shard scores its islands and returns its P highest keys in
+            descending order (see shard_top_keys). The shard heads are then merged with a heap of ShardKeys,
+            one per shard, until the P highest keys overall are found, and the pirates plunder from a heap of
+            those keys only, in the same way as simulate_day.
+            The score index is not used, so it is dropped and, with keep_index, the next simulate_day builds it again.
+        """
+        worth_islands = [
+            (island_name, self.island_dict[island_name].money, self.island_dict[island_name].marines)
+            for island_name in self.worth_names
+        ]
+        shards = [worth_islands[i::n_workers] for i in range(n_workers)]
+        if n_workers == 1:
+            shard_keys = [shard_top_keys(shards[0], crew, self.n_pirates)]
+        elif executor is not None:
+            shard_keys = list(executor.map(shard_top_keys, shards, [crew]*n_workers, [self.n_pirates]*n_workers))
+        else:
+            with ProcessPoolExecutor(n_workers) as pool:
+                shard_keys = list(pool.map(shard_top_keys, shards, [crew]*n_workers, [self.n_pirates]*n_workers))
+
+        # k-way merge of the shard heads, O(P*logS)
+        heads = MaxHeap(n_workers)
+        for shard, keys in enumerate(shard_keys):
+            if len(keys) != 0:
+                heads.add(ShardKey(keys[0].name, keys[0].score, shard, 0))
+        best_keys = []
+        while len(best_keys) < self.n_pirates and len(heads) != 0:
+            head = heads.peek()
+            keys = shard_keys[head.shard]
+            best_keys.append(keys[head.position])
+            # the next key of the same shard takes the place of the head, O(logS)
+            if head.position+1 < len(keys):
+                heads.replace_top(ShardKey(keys[head.position+1].name, keys[head.position+1].score, head.shard, head.position+1))
+            else:
+                heads.get_max()
+
+        # the score index is not kept up to date with the plunders of this day
+        self.score_index = None
+        return self.plunder(IndexedMaxHeap.heapify(best_keys, key=heap_key_name, arity=self.HEAP_ARITY), crew, None)
+
+    def plunder(self, score_heap: IndexedMaxHeap[HeapKey], crew: int,
+                score_index: CrewScoreIndex | None) -> list[tuple[Island|None, int]] | list[tuple[str|None, int]]:
+        """
+        Send the pirates of a day, one after the other, to the best island in score_heap and score_index, keeping
+        score_heap, score_index and worth_names up to date with the plunders. See simulate_day.
+
+        :complexity: O(P + K*logN), where P is the number of pirates, N is the number of islands and K is the
+                     number of islands that went through score_heap
+        """
         # create a list to store the plundered island and number of crew sent to the island
-        island_crew_l: list[tuple[Island|None, int]] = []
+        island_crew_l: list[tuple[Island|None, int]] | list[tuple[str|None, int]] = []
         crew_available = crew
-        # create a heap to store the score that the pirate will get for each island that have money-marine ratio greater than 2
-        # If money-marine ratio <= 2, no plundering will result in higher score, thus whenever an island have money-marine ratio <= 2, 
-        # it is not stored into the score heap
-        score_heap = MaxHeap(len(self.island_dict))
-
-        # create a list named 'island_score_l' and append all the island and score into the list for heapifying 
-        island_score_l = []
-        # O(N)
-        for island in self.island_dict.values():
-            marine = island.marines
-            money = island.money
-            crew_left = crew_available-marine
-            try:
-                if money/marine > 2:
-                    score = money/marine*min(crew_available,marine)+2*max(0, crew_left)
-                    # compute the sorted key for MaxHeap using HeapKey class, which is an auxiliary class to store information for both
-                    # scores and island name in the key
-                    key = HeapKey(island.name, score)
-                    island_score_l.append(key)   # append in python list take O(1) complexity
-            except ZeroDivisionError:   # handle situation for an island with zero marine left after being looped by one round
-                continue
-           
-        # O(N)
-        # Heapifying the island score list
-        score_heap = score_heap.heapify(island_score_l)
-
-        # O(C*log(N))
-        for _ in range(self.n_pirates):
-            # still have island that can be plundered to make higher score
-            if len(score_heap) != 0:
-                # get the island name and score pair stored in HeapKey class
-                tar_heapkey:HeapKey = score_heap.get_max()  # O(logN)
-                # get the corresponding island name
-                island_name = tar_heapkey.name
-                tar_island: Island = self.island_dict[island_name]
-                marine = tar_island.marines
-                money = tar_island.money
-                crew_left = crew_available-marine   # marine is the crew required to loot the whole island
-                # have enough crew to loot the whole island (other crew wont come back and loot this island since its resources is completely loop)
-                if crew_left >= 0:
+        in_place = self.in_place
+        if score_index is None:
+            # an empty index, score_heap already holds every island that can be plundered today
+            score_index = CrewScoreIndex(crew, self.island_dict)
+        # names of the islands that were partially plundered today
+        plundered_names = set()
+
+        # O(P + K*log(N))
+        pirate = 0
+        while pirate < self.n_pirates:
+            # take the islands out of the index while one of them might be better than the top of the heap, O(logN) each
+            while len(score_index) != 0 and (len(score_heap) == 0 or score_index.best_score() >= score_heap.peek().score):
+                score_heap.add(score_index.pop_best())
+            # no plundering will make higher score, and the same for all the remaining pirates
+            if len(score_heap) == 0:
+                island_crew_l.extend([(None, 0)]*(self.n_pirates-pirate))
+                break
+            # get the island name and score pair stored in HeapKey class
+            tar_heapkey: HeapKey = score_heap.peek()   # O(1)
+            # get the corresponding island name
+            island_name = tar_heapkey.name
+            tar_island: Island = self.island_dict[island_name]
+            marine = tar_island.marines
+            money = tar_island.money
+            crew_left = crew_available-marine   # marine is the crew required to loot the whole island
+            # have enough crew to loot the whole island (other crew wont come back and loot this island since its resources is completely loop)
+            if crew_left >= 0:
+                if in_place:
+                    tar_island.money = 0
+                    tar_island.marines = 0
+                    island_crew_l.append((island_name, marine))
+                else:
                     updated_island = Island(tar_island.name, 0, 0)
                     self.island_dict[tar_island.name] = updated_island  # update island state in the island_dict
                     island_crew_l.append((updated_island, marine))
-                # not enough crew to loot the whole island (the island can still be looted by other crew )
-                else:
-                    money_plundered = crew_available*money/marine
-                    marine_left = marine - crew_available
-                    money_left = money-money_plundered
-                    updated_island = Island(tar_island.name, money_left, marine_left)
-                    island_crew_l.append((updated_island, crew_available))
-                    self.island_dict[island_name] = updated_island
-                    # recompute the updated key and add it into the heap
-                    updated_crew_left = crew_available-marine_left  # compute crew-left if other pirate loot this island again
-                    updated_score = money_left/marine_left*min(crew_available,marine_left)+2*max(0, updated_crew_left)
-                    updated_key = HeapKey(tar_island.name, updated_score)
-                    # reappend the island score pair into the score_heap
-                    score_heap.add(updated_key)     # O(logN)
-
-            # no plundering will make higher score
+                self.worth_names.discard(island_name)
+                score_heap.get_max()    # O(logN)
+                pirate += 1
+            # not enough crew to loot the whole island (the island can still be looted by other crew )
             else:
-                island_crew_l.append((None, 0))
+                # The next pirates keep plundering this island while it cannot be looted completely and its score
+                # stays above the runner-up, the best score of the other islands in score_heap and score_index,
+                # so the whole run only goes through the money and marines of the island.
+                second_heapkey = score_heap.peek_second()   # O(arity)
+                runner_up = second_heapkey.score if second_heapkey is not None else float('-inf')
+                if len(score_index) != 0:
+                    runner_up = max(runner_up, score_index.best_score())
+                run_end = pirate
+                while True:
+                    money_plundered = crew_available*money/marine
+                    marine = marine - crew_available
+                    money = money-money_plundered
+                    if not in_place:
+                        island_crew_l.append((Island(island_name, money, marine), crew_available))
+                    run_end += 1
+                    # same floating point operations as plunder_score for a partial plunder
+                    if run_end == self.n_pirates or marine <= crew_available or money/marine*crew_available <= runner_up:
+                        break
+                if in_place:
+                    tar_island.money = money
+                    tar_island.marines = marine
+                    island_crew_l.extend([(island_name, crew_available)]*(run_end-pirate))
+                else:
+                    self.island_dict[island_name] = island_crew_l[-1][0]
+                plundered_names.add(island_name)
+                # recompute the score of the island and sink it to its new position, the key is reused since
+                # replace_top takes it out of the heap before putting it back
+                tar_heapkey.score = plunder_score(money, marine, crew_available)
+                score_heap.replace_top(tar_heapkey)     # O(logN)
+                pirate = run_end
+
+        # The rest of the day still offers a partially plundered island, but from the next day on it is only
+        # worth plundering if its money-marine ratio (after rounding) is still greater than 2.
+        for island_name in plundered_names:
+            if island_name in self.worth_names and not is_worth_plundering(self.island_dict[island_name]):
+                self.worth_names.discard(island_name)
+        # the islands taken out of the index today go back in, O(K*logN)
+        if score_index is self.score_index:
+            for k in range(1, len(score_heap) + 1):
+                island_name = score_heap.the_array[k].name
+                if island_name in self.worth_names:
+                    score_index.add(self.island_dict[island_name])
         return island_crew_l
 
 
+class CrewScoreIndex:
+    """
+    Index of the islands worth plundering, split at a crew size into two groups, each kept in an IndexedMaxHeap
+    ordered by a value that does not depend on the crew size:
+    - 'looted', the islands with marines <= crew, which a pirate loots completely for a score of
+      (money - 2*marines) + 2*crew. They are ordered by money - 2*marines.
+    - 'partial', the islands with marines > crew, which a pirate plunders partially for a score of
+      money/marines*crew. They are ordered by money-marine ratio.
+    Within a group, the score is a non-decreasing function of the value the group is ordered by (with the
+    same floating point operations as plunder_score), so the best score of a group is the score of its top.
+    Each group also has a heap by marines, 'looted_marines' with the most marines on top and 'partial_marines'
+    with the fewest, so that when the crew size changes the islands moving to the other group are found at
+    the top of these heaps.
+    """
 
-@dataclass
+    def __init__(self, crew: int, island_dict: dict[str, Island], arity: int = 2) -> None:
+        """
+        Initialise an empty index for the given crew size, for islands taken from island_dict,
+        with heaps of the given arity.
+        :complexity: O(1)
+        """
+        self.crew = crew
+        self.island_dict = island_dict
+        self.looted: IndexedMaxHeap[HeapKey] = IndexedMaxHeap(1, key=heap_key_name, arity=arity)
+        self.looted_marines: IndexedMaxHeap[HeapKey] = IndexedMaxHeap(1, key=heap_key_name, arity=arity)
+        self.partial: IndexedMaxHeap[HeapKey] = IndexedMaxHeap(1, key=heap_key_name, arity=arity)
+        self.partial_marines: IndexedMaxHeap[HeapKey] = IndexedMaxHeap(1, key=heap_key_name, arity=arity)
+
+    @classmethod
+    def build(cls, crew: int, island_dict: dict[str, Island], names: Iterable[str], arity: int = 2) -> CrewScoreIndex:
+        """
+        Index of the islands with the given names, which must all be worth plundering.
+        :complexity: O(N), where N is the number of names
+        """
+        index = cls(crew, island_dict, arity)
+        looted, looted_marines, partial, partial_marines = [], [], [], []
+        for island_name in names:
+            island = island_dict[island_name]
+            if island.marines <= crew:
+                looted.append(HeapKey(island_name, island.money - 2*island.marines))
+                looted_marines.append(HeapKey(island_name, island.marines))
+            else:
+                partial.append(HeapKey(island_name, island.money/island.marines))
+                partial_marines.append(HeapKey(island_name, -island.marines))
+        index.looted = IndexedMaxHeap.heapify(looted, key=heap_key_name, arity=arity)
+        index.looted_marines = IndexedMaxHeap.heapify(looted_marines, key=heap_key_name, arity=arity)
+        index.partial = IndexedMaxHeap.heapify(partial, key=heap_key_name, arity=arity)
+        index.partial_marines = IndexedMaxHeap.heapify(partial_marines, key=heap_key_name, arity=arity)
+        return index
+
+    def __len__(self) -> int:
+        """
+        Number of islands in the index.
+        :complexity: O(1)
+        """
+        return len(self.looted) + len(self.partial)
+
+    def __contains__(self, island_name: str) -> bool:
+        """
+        True if the island with this name is in the index.
+        :complexity: O(1)
+        """
+        return island_name in self.looted or island_name in self.partial
+
+    def add(self, island: Island) -> None:
+        """
+        Add an island to the group it belongs to for the current crew size.
+        :pre: the island is worth plundering and not in the index
+        :complexity: O(logN)
+        """
+        if island.marines <= self.crew:
+            self.looted.add(HeapKey(island.name, island.money - 2*island.marines))
+            self.looted_marines.add(HeapKey(island.name, island.marines))
+        else:
+            self.partial.add(HeapKey(island.name, island.money/island.marines))
+            self.partial_marines.add(HeapKey(island.name, -island.marines))
+
+    def remove(self, island_name: str) -> None:
+        """
+        Remove the island with this name from the index.
+        :complexity: O(logN)
+        :raises KeyError: if the island is not in the index
+        """
+        if island_name in self.looted:
+            self.looted.remove(island_name)
+            self.looted_marines.remove(island_name)
+        else:
+            self.partial.remove(island_name)
+            self.partial_marines.remove(island_name)
+
+    def set_crew(self, crew: int) -> None:
+        """
+        Change the crew size, moving the islands whose marines lie between the old and the new crew size
+        to the other group.
+        :complexity: O(C*logN), where C is the number of islands moved
+        """
+        old_crew = self.crew
+        self.crew = crew
+        if crew > old_crew:
+            while len(self.partial_marines) != 0 and -self.partial_marines.peek().score <= crew:
+                island_name = self.partial_marines.peek().name
+                self.remove(island_name)
+                self.add(self.island_dict[island_name])
+        elif crew < old_crew:
+            while len(self.looted_marines) != 0 and self.looted_marines.peek().score > crew:
+                island_name = self.looted_marines.peek().name
+                self.remove(island_name)
+                self.add(self.island_dict[island_name])
+
+    def best_score(self) -> float:
+        """
+        The highest score of the islands in the index for the current crew size.
+        :pre: the index is not empty
+        :complexity: O(1)
+        """
+        if len(self.partial) == 0:
+            return self.looted.peek().score + 2*self.crew
+        partial_score = self.partial.peek().score*self.crew
+        if len(self.looted) == 0:
+            return partial_score
+        looted_score = self.looted.peek().score + 2*self.crew
+        return looted_score if looted_score > partial_score else partial_score
+
+    def pop_best(self) -> HeapKey:
+        """
+        Remove the best island from the index, and return its HeapKey for the current crew size.
+        Of two islands with the best score, the one with the greater key (the smaller name) is taken
+        if they are in different groups.
+        :pre: the index is not empty
+        :complexity: O(logN)
+        """
+        best = None
+        if len(self.looted) != 0:
+            top = self.looted.peek()
+            best = HeapKey(top.name, top.score + 2*self.crew)
+        if len(self.partial) != 0:
+            top = self.partial.peek()
+            partial_key = HeapKey(top.name, top.score*self.crew)
+            if best is None or partial_key > best:
+                best = partial_key
+        self.remove(best.name)
+        return best
+
+
+def is_worth_plundering(island: Island) -> bool:
+    """
+    True if plundering the island can give a higher score than staying at home, i.e. its money-marine
+    ratio is greater than 2. An island with no marines left has nothing left to plunder.
+
+    :complexity: O(1)
+    """
+    try:
+        return island.money/island.marines > 2
+    except ZeroDivisionError:   # handle situation for an island with zero marine left after being looped by one round
+        return False
+
+
+def shard_top_keys(islands: list[tuple[str, float, int]], crew: int, count: int) -> list[HeapKey]:
+    """
+    Score a shard of (name, money, marines) islands for the given crew size, and return the keys of the
+    count islands with the highest scores, in descending order. Used by simulate_day_sharded in the
+    worker processes.
+
+    :complexity: O(N*log(count)), where N is the number of islands in the shard
+    """
+    keys = []
+    for name, money, marines in islands:
+        key = score_row(name, money, marines, crew)
+        if key is not None:
+            keys.append(key)
+    return top_keys(keys, count)
+
+
+def top_keys(keys: Iterable[HeapKey], count: int) -> list[HeapKey]:
+    """
+    The count greatest keys (or all of them, if there are fewer), in descending order.
+
+    :complexity: O(N*log(count)), where N is the number of keys
+
+    :further explanation:
+        The keys go through a MinHeap of at most count keys, holding the greatest keys seen so far. A key
+        only replaces the smallest key in the MinHeap (with pushpop) if it is greater, so only O(count) keys are stored.
+    """
+    if count <= 0:
+        return []
+    best = MinHeap(count)
+    for key in keys:
+        if len(best) < count:
+            best.add(key)   # O(log(count))
+        else:
+            best.pushpop(key)   # O(1) if key is not greater than the smallest key, O(log(count)) otherwise
+    descending = [None] * len(best)
+    for i in range(len(best) - 1, -1, -1):
+        descending[i] = best.get_min()
+    return descending
+
+
+def score_key(island: Island, crew: int) -> HeapKey | None:
+    """
+    Compute the HeapKey of an island for the given crew size, or None if the island is not worth plundering.
+
+    :complexity: O(1)
+    """
+    if not is_worth_plundering(island):
+        return None
+    # compute the sorted key for MaxHeap using HeapKey class, which is an auxiliary class to store information for both
+    # scores and island name in the key
+    return HeapKey(island.name, plunder_score(island.money, island.marines, crew))
+
+
+def score_row(name: str, money: float, marines: int, crew: int) -> HeapKey | None:
+    """
+    Same as score_key, for an island given as its name, money and marines, so that the rows of
+    shard_top_keys are scored without building an Island for each of them.
+
+    :complexity: O(1)
+    """
+    try:
+        if money/marines <= 2:   # same test as is_worth_plundering
+            return None
+    except ZeroDivisionError:
+        return None
+    return HeapKey(name, plunder_score(money, marines, crew))
+
+
+def plunder_score(money: float, marines: int, crew: int) -> float:
+    """
+    Score of a pirate with the given crew size that plunders an island with the given money and marines:
+    the money plundered plus 2 for every crew member left.
+    If the crew can loot the whole island, this is (money - 2*marines) + 2*crew, otherwise it is money/marines*crew.
+    The floating point operations are the ones of CrewScoreIndex, so that its order matches the scores.
+
+    :complexity: O(1)
+    """
+    if marines <= crew:
+        return (money - 2*marines) + 2*crew
+    return money/marines*crew
+
+
+def heap_key_name(key: HeapKey) -> str:
+    """
+    Name of the island of a HeapKey, used to find the HeapKey in the score heap.
+    :complexity: O(1)
+    """
+    return key.name
+
+
+@dataclass(slots=True)
 class HeapKey:
     """
     An auxilliary class that is use to creat sorted key for the MaxHeap. In details, the sorted key created by HeapKey class
@@ -139,39 +616,50 @@ class HeapKey:
     def __ge__(a: HeapKey, b: HeapKey):
         """
         Magic method greater than equal
-        Compare two KeyStore based on their moneymarine ratio
+        Compare two KeyStore based on their score, and on their island name if the scores are the same
 
         :complexity: O(1), all the operations are of constant time
         """
-        return (a.score >= b.score)
+        return not (a < b)
     
     def __gt__(a: HeapKey, b: HeapKey):
         """
         Magic method greater than
-        Compare two KeyStore based on their moneymarine ratio
+        Compare two KeyStore based on their score. For the same score, the island with the smaller name
+        is the greater key, so that the heap always picks islands in the same order no matter how it was built.
 
         :complexity: O(1), all the operations are of constant time
         """
-        return (a.score > b.score)
+        return a.score > b.score or (a.score == b.score and a.name < b.name)
         
     def __le__(a: HeapKey, b: HeapKey):
         """
         Magic method less than equal
-        Compare two KeyStore based on their moneymarine ratio
+        Compare two KeyStore based on their score, and on their island name if the scores are the same
 
         :complexity: O(1), all the operations are of constant time
         """
-        return (a.score <= b.score)
+        return not (a > b)
     
-    # def __lt__(a: HeapKey, b: HeapKey):
-    #     """
-    #     Magic method less than
-    #     Compare two KeyStore based on their moneymarine ratio
-
-    #     :complexity: O(1), all the operations are of constant time
-    #     """
-    #     return (a.score < b.score)
+    def __lt__(a: HeapKey, b: HeapKey):
+        """
+        Magic method less than
+        Compare two KeyStore based on their score, and on their island name if the scores are the same
+
+        :complexity: O(1), all the operations are of constant time
+        """
+        return b > a
     
+@dataclass(slots=True)
+class ShardKey(HeapKey):
+    """
+    Head of the keys of one shard in simulate_day_sharded: the HeapKey at the given position of the
+    keys returned by the given shard. It is ordered like a HeapKey.
+    """
+    shard: int
+    position: int
+
+
 if __name__ == "__main__":
     a = Island("A", 400, 100)
     b = Island("B", 300, 150)
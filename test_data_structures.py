@@ -0,0 +1,470 @@
+from unittest import TestCase
+from ed_utils.timeout import timeout
+from ed_utils.decorators import number, visibility
+from random_gen import RandomGen
+
+from data_structures.avl import AVLTree
+from data_structures.bst import BinarySearchTree, BSTPostOrderIterator
+from data_structures.heap import MaxHeap, DaryMaxHeap, MinHeap
+from data_structures.indexed_heap import IndexedMaxHeap
+from data_structures.order_statistic_tree import OrderStatisticTree
+from data_structures.referential_array import ArrayR, CTypesArrayR
+from data_structures.aset import ASet
+from data_structures.hash_table import LinearProbeTable, CachedHashTable, builtin_hash, polynomial_hash, next_prime
+
+class AVLTreeTests(TestCase):
+
+    def check_balanced(self, tree: AVLTree):
+        for node in BSTPostOrderIterator(tree.root):
+            self.assertEqual(node.height, 1 + max(tree.get_height(node.left), tree.get_height(node.right)))
+            self.assertLessEqual(abs(tree.get_balance(node)), 1)
+
+    @number("3.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_sorted_inserts(self):
+        tree = AVLTree()
+        for key in range(2047):
+            tree[key] = str(key)
+        self.check_balanced(tree)
+        self.assertLessEqual(tree.root.height, 12)
+        self.assertListEqual([node.key for node in tree], list(range(2047)))
+        self.assertEqual(tree[1000], "1000")
+
+    @number("3.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_deletes(self):
+        RandomGen.set_seed(1054)
+        keys = list(range(1000))
+        RandomGen.random_shuffle(keys)
+        tree = AVLTree()
+        for key in keys:
+            tree[key] = key
+        for key in keys[:600]:
+            del tree[key]
+        self.check_balanced(tree)
+        self.assertEqual(len(tree), 400)
+        self.assertListEqual([node.key for node in tree], [key for key in range(1000) if key not in set(keys[:600])])
+        with self.assertRaises(ValueError):
+            del tree[keys[0]]
+
+    @number("3.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_from_items(self):
+        RandomGen.set_seed(7)
+        keys = list(range(1023))
+        RandomGen.random_shuffle(keys)
+        tree = AVLTree.from_items([(key, str(key)) for key in keys])
+        self.check_balanced(tree)
+        self.assertEqual(tree.root.height, 10)
+        self.assertEqual(len(tree), 1023)
+        self.assertListEqual([node.item for node in tree], [str(key) for key in range(1023)])
+        # The bulk-loaded tree keeps working as a normal AVL tree.
+        for key in range(1023, 1100):
+            tree[key] = str(key)
+        del tree[0]
+        self.check_balanced(tree)
+        with self.assertRaises(ValueError):
+            AVLTree.from_items([(1, "a"), (0, "b"), (1, "c")])
+
+
+class BinarySearchTreeTests(TestCase):
+
+    @number("3.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_skewed_tree(self):
+        # A tree built from sorted keys is a linked list, which should not hit the recursion limit.
+        tree = BinarySearchTree()
+        for key in range(2000):
+            tree[key] = key
+        self.assertEqual(tree[1999], 1999)
+        self.assertNotIn(2000, tree)
+        with self.assertRaises(ValueError):
+            tree[10] = 10
+        for key in range(0, 2000, 2):
+            del tree[key]
+        self.assertEqual(len(tree), 1000)
+        self.assertListEqual([node.key for node in tree], list(range(1, 2000, 2)))
+
+    @number("3.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_deletes(self):
+        RandomGen.set_seed(2023)
+        keys = list(range(500))
+        RandomGen.random_shuffle(keys)
+        tree = BinarySearchTree()
+        for key in keys:
+            tree[key] = str(key)
+        removed = set()
+        for key in keys[::3]:
+            del tree[key]
+            removed.add(key)
+            self.assertNotIn(key, tree)
+        self.assertListEqual([node.key for node in tree], [key for key in range(500) if key not in removed])
+        self.assertEqual(tree.get_minimal(tree.root).key, min(set(range(500)) - removed))
+        with self.assertRaises(ValueError):
+            del tree[keys[0]]
+        with self.assertRaises(KeyError):
+            _ = tree[keys[0]]
+
+
+class OrderStatisticTreeTests(TestCase):
+
+    def check_aggregates(self, tree: OrderStatisticTree):
+        for node in BSTPostOrderIterator(tree.root):
+            children = [child for child in [node.left, node.right] if child is not None]
+            self.assertEqual(node.size, 1 + sum(child.size for child in children))
+            self.assertEqual(node.weight_sum, node.item[0] + sum(child.weight_sum for child in children))
+            self.assertEqual(node.value_sum, node.item[1] + sum(child.value_sum for child in children))
+
+    @number("3.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_aggregates_and_queries(self):
+        RandomGen.set_seed(1008)
+        keys = list(range(300))
+        RandomGen.random_shuffle(keys)
+        # Items are (weight, value) pairs.
+        tree = OrderStatisticTree(weight=lambda item: item[0], value=lambda item: item[1])
+        for key in keys:
+            tree[key] = (key % 7, 3 * (key % 7))
+        # Deleting keys with two children goes through the successor path.
+        for key in keys[:150]:
+            del tree[key]
+        self.check_aggregates(tree)
+        remaining = [key for key in range(300) if key not in set(keys[:150])]
+        self.assertEqual(len(tree), 150)
+        self.assertListEqual([tree.select(i).key for i in range(150)], remaining)
+        weights = [key % 7 for key in remaining]
+        self.assertEqual(tree.total_weight(), sum(weights))
+        self.assertEqual(tree.total_value(), 3 * sum(weights))
+        for budget in [0, 1, 10, 100, 200, sum(weights), sum(weights) + 5]:
+            self.assertAlmostEqual(tree.prefix_value(budget), 3 * min(budget, sum(weights)))
+        with self.assertRaises(IndexError):
+            tree.select(150)
+
+    @number("3.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_prefix_value_from_items(self):
+        items = [(2, 10), (0, 5), (4, 4), (1, 3)]
+        tree = OrderStatisticTree.from_items([(i, item) for i, item in enumerate(items)],
+                                             weight=lambda item: item[0], value=lambda item: item[1])
+        self.check_aggregates(tree)
+        self.assertEqual(tree.prefix_value(0), 0)
+        self.assertEqual(tree.prefix_value(1), 5)
+        self.assertEqual(tree.prefix_value(2), 10)
+        self.assertEqual(tree.prefix_value(3), 16)
+        self.assertEqual(tree.prefix_value(6), 19)
+        self.assertEqual(tree.prefix_value(7), 22)
+        self.assertEqual(tree.prefix_value(100), 22)
+
+    @number("3.20")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_rank_and_iter_from(self):
+        RandomGen.set_seed(20)
+        tree = OrderStatisticTree()
+        keys = []
+        for _ in range(200):
+            key = RandomGen.randint(0, 1000)
+            if key not in keys:
+                keys.append(key)
+                tree[key] = key
+        keys.sort()
+        for k in range(len(keys) + 1):
+            self.assertEqual([node.key for node in tree.iter_from(k)], keys[k:])
+        for key in range(-1, 1002, 7):
+            self.assertEqual(tree.rank(key), len([other for other in keys if other < key]))
+
+
+class IndexedMaxHeapTests(TestCase):
+
+    def check_index(self, heap):
+        self.assertEqual(len(heap.index), len(heap))
+        for name, k in heap.index.items():
+            self.assertEqual(heap.key(heap.the_array[k]), name)
+
+    @number("3.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_update_and_remove(self):
+        RandomGen.set_seed(8)
+        points = [(RandomGen.randint(1, 1000), f"n{i}") for i in range(300)]
+        heap = IndexedMaxHeap.heapify(points, key=lambda x: x[1])
+        current = dict((name, value) for value, name in points)
+        self.check_index(heap)
+        for i in range(300):
+            name = f"n{RandomGen.randint(0, 299)}"
+            if name not in heap:
+                continue
+            if i % 3 == 0:
+                heap.remove(name)
+                del current[name]
+            elif i % 3 == 1:
+                heap.increase_key((current[name] + RandomGen.randint(0, 100), name))
+                current[name] = heap.get(name)[0]
+            else:
+                heap.decrease_key((current[name] - RandomGen.randint(0, 100), name))
+                current[name] = heap.get(name)[0]
+        self.check_index(heap)
+        expected = sorted(((value, name) for name, value in current.items()), reverse=True)
+        self.assertEqual([heap.get_max() for _ in range(len(heap))], expected)
+
+    @number("3.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_invalid_operations(self):
+        heap = IndexedMaxHeap(1, key=lambda x: x[1])
+        heap.add((5, "a"))
+        heap.add((3, "b"))  # grows past the initial size
+        self.assertRaises(ValueError, heap.add, (1, "a"))
+        self.assertRaises(ValueError, heap.increase_key, (4, "a"))
+        self.assertRaises(ValueError, heap.decrease_key, (4, "b"))
+        self.assertRaises(KeyError, heap.remove, "c")
+        self.assertEqual(heap.get_max(), (5, "a"))
+        self.assertNotIn("a", heap)
+
+
+class MinHeapTests(TestCase):
+
+    @number("3.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_heap_order(self):
+        RandomGen.set_seed(10)
+        items = [RandomGen.randint(-100, 100) for _ in range(200)]
+        heap = MinHeap(len(items))
+        for item in items:
+            heap.add(item)
+        heap.add(0)     # grows past the initial size
+        items.append(0)
+        self.assertEqual(heap.peek(), min(items))
+        self.assertEqual([heap.get_min() for _ in range(len(items))], sorted(items))
+        self.assertRaises(IndexError, heap.get_min)
+        heap = MinHeap.heapify(items)
+        self.assertIsInstance(heap, MinHeap)
+        self.assertEqual(heap.replace_top(50), min(items))
+        # the pushed element comes straight back if it is not greater than the minimum
+        self.assertEqual(heap.pushpop(-1000), -1000)
+        self.assertEqual(heap.pushpop(1000), sorted(items)[1])
+        self.assertEqual(heap.peek(), sorted(items + [50])[2])
+
+
+class MaxHeapTests(TestCase):
+
+    @number("3.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_replace_and_update(self):
+        RandomGen.set_seed(11)
+        items = [RandomGen.randint(-100, 100) for _ in range(100)]
+        heap = MaxHeap(1)
+        for item in items:
+            heap.add(item)
+        self.assertEqual(heap.peek(), max(items))
+        self.assertEqual(heap.replace_top(-1000), max(items))
+        items.remove(max(items))
+        items.append(-1000)
+        # the pushed element comes straight back if it is not smaller than the maximum
+        self.assertEqual(heap.pushpop(1000), 1000)
+        self.assertEqual(heap.pushpop(-5), max(items))
+        items.remove(max(items))
+        items.append(-5)
+        for k in range(1, len(heap) + 1, 7):
+            items.remove(heap.the_array[k])
+            items.append(k - 50)
+            heap.update(k, k - 50)
+        self.assertEqual([heap.get_max() for _ in range(len(items))], sorted(items, reverse=True))
+        self.assertRaises(IndexError, heap.peek)
+        self.assertRaises(IndexError, heap.replace_top, 1)
+        self.assertEqual(heap.pushpop(3), 3)
+
+    @number("3.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_indexed_replace_and_update(self):
+        heap = IndexedMaxHeap.heapify([(5, "a"), (3, "b"), (4, "c")], key=lambda x: x[1])
+        self.assertEqual(heap.replace_top((1, "a")), (5, "a"))
+        self.assertEqual(heap.peek(), (4, "c"))
+        self.assertRaises(ValueError, heap.replace_top, (9, "b"))
+        self.assertEqual(heap.replace_top((2, "d")), (4, "c"))
+        self.assertNotIn("c", heap)
+        heap.update(heap.index["a"], (7, "e"))
+        self.assertNotIn("a", heap)
+        self.assertEqual(heap.pushpop((6, "f")), (7, "e"))
+        self.assertEqual(heap.index, {"f": heap.index["f"], "b": heap.index["b"], "d": heap.index["d"]})
+        for name, k in heap.index.items():
+            self.assertEqual(heap.the_array[k][1], name)
+        self.assertEqual([heap.get_max() for _ in range(len(heap))], [(6, "f"), (3, "b"), (2, "d")])
+
+    @number("3.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_dary_heaps(self):
+        RandomGen.set_seed(13)
+        items = [RandomGen.randint(-100, 100) for _ in range(200)]
+        for arity in [2, 3, 4, 8]:
+            heap = DaryMaxHeap(1, arity)
+            for item in items:
+                heap.add(item)
+            self.assertEqual([heap.get_max() for _ in range(len(items))], sorted(items, reverse=True))
+            heap = DaryMaxHeap.heapify(items, arity=arity)
+            self.assertEqual(heap.replace_top(0), max(items))
+            self.assertEqual(len(heap), len(items))
+
+            indexed = IndexedMaxHeap.heapify([(item, i) for i, item in enumerate(items)], key=lambda x: x[1], arity=arity)
+            for i in range(0, len(items), 3):
+                indexed.remove(i)
+            for name, k in indexed.index.items():
+                self.assertEqual(indexed.the_array[k][1], name)
+            expected = sorted(((item, i) for i, item in enumerate(items) if i % 3 != 0), reverse=True)
+            self.assertEqual([indexed.get_max() for _ in range(len(indexed))], expected)
+
+
+class ArrayRTests(TestCase):
+
+    @number("3.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bulk_operations(self):
+        for backend in [ArrayR, CTypesArrayR]:
+            array = backend.from_iterable(range(5), 8)
+            self.assertEqual(list(array), [0, 1, 2, 3, 4, None, None, None])
+            self.assertEqual(array[1:4], [1, 2, 3])
+            array.set_slice(5, "abc")
+            self.assertEqual(array[-3:], ["a", "b", "c"])
+            # slices keep the length of the array fixed
+            self.assertRaises(IndexError, array.set_slice, 7, [1, 2])
+            self.assertRaises(IndexError, array.set_slice, -1, [1])
+            self.assertRaises(ValueError, array.__setitem__, slice(0, 2), [1, 2, 3])
+            self.assertEqual(len(array), 8)
+            array.fill(0, 2, 4)
+            self.assertEqual(list(array), [0, 1, 0, 0, 4, "a", "b", "c"])
+            bigger = array.resize(10)
+            self.assertIsInstance(bigger, backend)
+            self.assertEqual(list(bigger), list(array) + [None, None])
+            self.assertEqual(list(array.resize(2)), [0, 1])
+            target = backend(9)
+            array.copy_into(target, 1)
+            self.assertEqual(list(target), [None] + list(array))
+            self.assertRaises(IndexError, array.copy_into, target, 2)
+            self.assertRaises(IndexError, array.__getitem__, 8)
+
+    @number("3.15")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_aset_union(self):
+        s = ASet(3)
+        for item in [1, 4, 5]:
+            s.add(item)
+        t = ASet(4)
+        for item in [4, 2, 6]:
+            t.add(item)
+        union = s.union(t)
+        self.assertEqual(len(union), 5)
+        self.assertEqual(sorted(union.array[i] for i in range(len(union))), [1, 2, 4, 5, 6])
+
+
+class HashTableTests(TestCase):
+
+    def check_table(self, table, expected):
+        self.assertEqual(len(table), len(expected))
+        self.assertEqual(sorted(table.keys()), sorted(expected))
+        size = table.table_size
+        for position, item in enumerate(table.array):
+            if item is not None:
+                # every position between the home of a key and the key itself is taken
+                for step in range((position - item[0]) % size):
+                    self.assertIsNotNone(table.array[(item[0] + step) % size])
+        for key, value in expected.items():
+            self.assertEqual(table[key], value)
+
+    @number("3.16")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_cached_hash_table(self):
+        for robin_hood in [True, False]:
+            RandomGen.set_seed(16)
+            table = CachedHashTable(robin_hood=robin_hood)
+            expected = {}
+            for step in range(3000):
+                key = "k" + str(RandomGen.randint(0, 400))
+                if RandomGen.randint(0, 2) == 0 and key in expected:
+                    del table[key]
+                    del expected[key]
+                    self.assertNotIn(key, table)
+                else:
+                    table[key] = step
+                    expected[key] = step
+                if step % 100 == 0:
+                    self.check_table(table, expected)
+            self.check_table(table, expected)
+            self.assertRaises(KeyError, table.__delitem__, "missing")
+            self.assertLess(max(table.probe_lengths()), table.table_size)
+
+    @number("3.17")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_full_load_factor(self):
+        # with a max_load_factor of 1 the table fills up, and grows before taking one more key
+        for table in [LinearProbeTable(sizes=[5], max_load_factor=1), CachedHashTable(sizes=[5], max_load_factor=1)]:
+            for i in range(5):
+                table[str(i)] = i
+            self.assertTrue(table.is_full())
+            table["0"] = 10
+            self.assertEqual(table.table_size, 5)
+            table["5"] = 5
+            self.assertEqual(table.table_size, next_prime(11))
+            del table["2"]
+            expected = {"0": 10, "1": 1, "3": 3, "4": 4, "5": 5}
+            self.assertEqual(sorted(table.keys()), sorted(expected))
+            for key, value in expected.items():
+                self.assertEqual(table[key], value)
+        self.check_table(table, expected)
+
+    @number("3.18")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hashers(self):
+        self.assertEqual(polynomial_hash("Island 1", 13), polynomial_hash("Island 1", 13))
+        self.assertEqual(LinearProbeTable(hasher=polynomial_hash).hash("Island 1"), polynomial_hash("Island 1", 5))
+        for hasher in [builtin_hash, polynomial_hash]:
+            for memo in [False, True]:
+                for table in [LinearProbeTable(hasher=hasher, memo=memo),
+                              CachedHashTable(hasher=hasher, memo=memo)]:
+                    expected = {}
+                    for i in range(300):
+                        table["Island " + str(i)] = i
+                        expected["Island " + str(i)] = i
+                        # looking keys up while the table grows, so that the memo sees every size
+                        self.assertEqual(table["Island " + str(i // 2)], i // 2)
+                    for i in range(0, 300, 3):
+                        del table["Island " + str(i)]
+                        del expected["Island " + str(i)]
+                    self.assertEqual(sorted(table.keys()), sorted(expected))
+                    for key, value in expected.items():
+                        self.assertEqual(table[key], value)
+                    self.assertNotIn("Island 0", table)
+                    if memo:
+                        # only the keys in the table are kept in the memo
+                        self.assertEqual(sorted(table.hash_memo), sorted(expected))
+
+    @number("3.19")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_growth_and_shrinking(self):
+        self.assertRaises(ValueError, LinearProbeTable, max_load_factor=0)
+        self.assertRaises(ValueError, CachedHashTable, max_load_factor=1.5)
+        for table in [LinearProbeTable(sizes=[5, 13]), CachedHashTable(sizes=[5, 13], max_load_factor=0.75),
+                      LinearProbeTable(sizes=[5, 13], hasher=polynomial_hash, memo=True)]:
+            for i in range(2000):
+                table[str(i)] = i
+                self.assertLessEqual(len(table), table.table_size * table.max_load_factor)
+            # every size past the given ones is a prime larger than twice the previous one
+            for previous, size in zip(table.TABLE_SIZES[1:], table.TABLE_SIZES[2:]):
+                self.assertGreater(size, 2 * previous)
+                self.assertEqual(next_prime(size), size)
+            grown = table.table_size
+            for i in range(1990):
+                del table[str(i)]
+            self.assertLess(table.table_size, grown)
+            self.assertEqual(sorted(table.keys()), sorted(str(i) for i in range(1990, 2000)))
+            for i in range(1990, 2000):
+                self.assertEqual(table[str(i)], i)
+        self.assertEqual([next_prime(n) for n in [0, 2, 4, 14, 97]], [2, 2, 5, 17, 97])
+        # a sparse table does not shrink into a size its keys do not fit in
+        for table in [LinearProbeTable(sizes=[5, 1000]), CachedHashTable(sizes=[5, 1000])]:
+            for i in range(100):
+                table[str(i)] = i
+            del table["0"]
+            self.assertEqual(table.table_size, 1000)
+            self.assertEqual(sorted(table.keys()), sorted(str(i) for i in range(1, 100)))
+            for i in range(1, 98):
+                del table[str(i)]
+            self.assertEqual(table.table_size, 5)
+            self.assertEqual(table["99"], 99)
@@ -1,9 +1,11 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from ed_utils.timeout import timeout
 from ed_utils.decorators import number, visibility
 from random_gen import RandomGen
 
 from island import Island
+from island_table import IslandTable
+import mode1
 from mode1 import Mode1Navigator
 
 class Mode1Tests(TestCase):
@@ -110,3 +112,137 @@ class Mode1Tests(TestCase):
         nav = Mode1Navigator(self.islands, 200)
         results = nav.select_islands_from_crew_numbers([0, 200, 500, 300, 40])
         self.assertListEqual(results, [0, 865, 1450, 1160, 240])
+
+    @number("1.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_crew_numbers_after_updates(self):
+        self.load_basic()
+        nav = Mode1Navigator(self.islands, 200)
+        self.assertListEqual(nav.select_islands_from_crew_numbers([5, 105, 445, 1000]), [100, 500, 1450, 1450])
+        # Island C now has more marines than anyone else, so it is looted last.
+        nav.update_island(self.islands[2], 100, 400)
+        results = nav.select_islands_from_crew_numbers([0, 100, 440, 840, 1000])
+        self.assertListEqual(results, [0, 400, 1350, 1450, 1450])
+
+    @number("1.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_sorted_ratios(self):
+        # Islands arriving in ratio order should not degrade the tree.
+        islands = [Island(str(i), 100, i + 1) for i in range(3000)]
+        nav = Mode1Navigator(islands, 10)
+        self.assertLessEqual(nav.bst_store.root.height, 18)
+        selected = nav.select_islands()
+        self.assertEqual(selected[0], (islands[0], 1))
+        self.assertEqual(selected[3], (islands[3], 4))
+        self.assertEqual(selected[4], (islands[4], 0))
+
+    @number("1.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_cached_selection(self):
+        self.load_basic()
+        nav = Mode1Navigator(self.islands, 200)
+        selected = nav.select_islands()
+        # Changing the returned list should not change later selections.
+        selected.clear()
+        self.check_solution(self.islands, 200, nav.select_islands(), 865)
+        # Island B gets cheaper than every other island, so the whole allocation shifts.
+        nav.update_island(self.islands[1], 300, 1)
+        self.islands[1].marines = 1
+        selected = nav.select_islands()
+        self.assertEqual((selected[0][0].name, selected[0][1]), ("B", 1))
+        self.check_solution(self.islands, 200, selected, 1162)
+        self.check_solution(self.islands, 200, nav.select_islands(), 1162)
+
+    @number("1.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_ratios(self):
+        # Every island here has the same marine-money ratio.
+        islands = [Island(name, 10 * (i + 1), i + 1) for i, name in enumerate("PQRSTUVW")]
+        nav = Mode1Navigator(islands, 10)
+        self.check_solution(islands, 10, nav.select_islands(), 100)
+        self.assertEqual(nav.select_islands_from_crew_numbers([36, 100]), [360, 360])
+        # Only island S should change, even though all islands share its old ratio.
+        nav.update_island(islands[3], 40, 1)
+        islands[3].marines = 1
+        self.assertEqual(len(nav.bst_store), 8)
+        selected = nav.select_islands()
+        self.assertEqual((selected[0][0].name, selected[0][1]), ("S", 1))
+        self.check_solution(islands, 10, selected, 130)
+        self.assertEqual(nav.select_islands_from_crew_numbers([33]), [360])
+
+    @number("1.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_update_by_name(self):
+        self.load_basic()
+        nav = Mode1Navigator(self.islands, 200)
+        nav.update_island_by_name("A", 400, 1)
+        self.islands[0].marines = 1
+        self.check_solution(self.islands, 200, nav.select_islands(), 1158)
+        # The copy of island A given here is outdated, but the island is found by its name.
+        nav.update_island(Island("A", 400, 100), 400, 100)
+        self.islands[0].marines = 100
+        self.check_solution(self.islands, 200, nav.select_islands(), 865)
+        self.assertEqual(len(nav.bst_store), 5)
+        with self.assertRaises(KeyError):
+            nav.update_island_by_name("Z", 1, 1)
+
+    @number("1.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_batch_updates(self):
+        RandomGen.set_seed(1009)
+        islands = [Island(str(i), RandomGen.randint(1, 500), RandomGen.randint(1, 300)) for i in range(40)]
+        nav = Mode1Navigator(islands, 1000)
+        for batch in [
+            [("3", 50, 2)],     # small batch, applied one update at a time
+            [(str(i), RandomGen.randint(1, 500), RandomGen.randint(1, 300)) for i in range(0, 40, 3)] + [("3", 60, 1)],
+        ]:
+            nav.update_islands(batch)
+            for name, money, marines in batch:
+                islands[int(name)] = Island(name, money, marines)
+            expected = Mode1Navigator(islands, 1000)
+            self.assertListEqual(nav.select_islands(), expected.select_islands())
+            crews = [0, 10, 500, 1000, 5000, 20000]
+            for got, want in zip(nav.select_islands_from_crew_numbers(crews), expected.select_islands_from_crew_numbers(crews)):
+                self.assertAlmostEqual(got, want)
+        self.assertEqual(nav.name_index["3"], (1/60, "3"))
+        with self.assertRaises(KeyError):
+            nav.update_islands([("1", 10, 10), ("missing", 10, 10)])
+        self.assertEqual(nav.bst_store[nav.name_index["1"]].money, islands[1].money)
+
+    @number("1.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @skipIf(mode1.np is None, "NumPy is not installed")
+    def test_vectorised_crew_numbers(self):
+        RandomGen.set_seed(1010)
+        islands = [Island(str(i), RandomGen.randint(1, 500), RandomGen.randint(0, 300)) for i in range(200)]
+        nav = Mode1Navigator(islands, 1000)
+        crews = [RandomGen.randint(-5, 40000) for _ in range(100)] + [0, 1, 30000]
+        results = nav.select_islands_from_crew_numbers(crews)
+        self.assertIsNotNone(nav.crew_engine)
+        for got, crew in zip(results, crews):
+            self.assertAlmostEqual(got, nav.bst_store.prefix_value(crew))
+        # Updates drop the engine, so the next answers use the updated islands.
+        nav.update_island_by_name("0", 10**6, 1)
+        self.assertIsNone(nav.crew_engine)
+        results = nav.select_islands_from_crew_numbers(crews)
+        for got, crew in zip(results, crews):
+            self.assertAlmostEqual(got, nav.bst_store.prefix_value(crew))
+
+    @number("1.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_island_table(self):
+        RandomGen.set_seed(1011)
+        islands = [Island(str(i), RandomGen.randint(1, 500), RandomGen.randint(0, 300)) for i in range(60)]
+        table = IslandTable.from_islands(islands)
+        self.assertEqual(len(table), 60)
+        self.assertEqual(table[-1], islands[-1])
+        # the rows are views, changing one changes the columns
+        table[3].marines = 7
+        self.assertEqual(table.marines[3], 7)
+        self.assertEqual(table[3].copy(), Island("3", islands[3].money, 7))
+        table[3].marines = islands[3].marines
+        # the navigators take the islands of a table as Island instances
+        self.assertEqual(table.to_islands(), islands)
+        nav = Mode1Navigator(table.to_islands(), 2000)
+        expected = Mode1Navigator(islands, 2000)
+        self.assertListEqual(nav.select_islands(), expected.select_islands())
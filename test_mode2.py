@@ -4,6 +4,7 @@ from ed_utils.decorators import number, visibility
 from random_gen import RandomGen
 
 from island import Island
+from island_table import IslandTable
 from mode2 import Mode2Navigator
 
 class Mode2Tests(TestCase):
@@ -121,3 +122,180 @@ class Mode2Tests(TestCase):
             # Score
             score = 2 * (100 - sent_crew) + received
             self.assertEqual(score, expected)
+
+    @number("2.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_kept_heap_matches_rebuilt(self):
+        RandomGen.set_seed(2)
+        islands = [
+            Island(f"I{i}", RandomGen.randint(1, 500), RandomGen.randint(1, 150))
+            for i in range(200)
+        ]
+        kept = Mode2Navigator(30, keep_index=True)
+        kept.add_islands(islands)
+        rebuilt = Mode2Navigator(30)
+        rebuilt.add_islands(islands)
+        for day, crew in enumerate([60, 60, 60, 25, 25, 90, 90]):
+            if day == 4:
+                extra = [Island("I3", 800, 40), Island("NEW", 600, 70)]
+                kept.add_islands(extra)
+                rebuilt.add_islands(extra)
+            self.assertEqual(kept.simulate_day(crew), rebuilt.simulate_day(crew))
+            self.assertEqual(kept.island_dict, rebuilt.island_dict)
+
+    @number("2.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_many_pirates(self):
+        nav = Mode2Navigator(10**5)
+        nav.add_islands([Island("Big", 10**6, 10**5), Island("Small", 300, 10), Island("Poor", 10, 10)])
+        results = nav.simulate_day(10)
+        self.assertEqual(results[0], (Island("Small", 0, 0), 10))
+        # the next 10**4 pirates plunder 10 marines of Big each, and every pirate after that stays at home
+        for island, sent_crew in results[1:10**4+1]:
+            self.assertEqual(island.name, "Big")
+            self.assertEqual(sent_crew, 10)
+        self.assertEqual(results[10**4][0].marines, 0)
+        self.assertEqual(results[10**4+1:], [(None, 0)]*(10**5-10**4-1))
+        self.assertEqual(nav.island_dict["Poor"], Island("Poor", 10, 10))
+
+    @number("2.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_simulate_days(self):
+        self.load_basic()
+        crews = [100, 100, 40, 40, 40, 150]
+        looped = Mode2Navigator(3)
+        looped.add_islands(self.islands)
+        expected = [looped.simulate_day(crew) for crew in crews]
+        streamed = Mode2Navigator(3)
+        streamed.add_islands(self.islands)
+        days = streamed.simulate_days(iter(crews))
+        self.assertEqual(next(days), expected[0])
+        # the score index is kept between the days of the generator, and released at the end
+        self.assertIsNotNone(streamed.score_index)
+        self.assertEqual(list(days), expected[1:])
+        self.assertIsNone(streamed.score_index)
+        self.assertFalse(streamed.keep_index)
+        self.assertEqual(streamed.island_dict, looped.island_dict)
+        # B has money-marine ratio 2 and the other islands are looted
+        self.assertEqual(streamed.worth_names, set())
+
+    @number("2.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_in_place(self):
+        self.load_basic()
+        copied = Mode2Navigator(4)
+        copied.add_islands(self.islands)
+        expected = copied.simulate_day(50) + copied.simulate_day(60)
+        nav = Mode2Navigator(4, in_place=True)
+        nav.add_islands(self.islands)
+        results = nav.simulate_day(50) + nav.simulate_day(60)
+        self.assertEqual(results, [
+            (island.name if island is not None else None, sent_crew)
+            for island, sent_crew in expected
+        ])
+        snapshot = nav.snapshot()
+        self.assertEqual(snapshot, copied.island_dict)
+        # the islands added to the sea are the ones that changed, and the snapshot is not affected by later days
+        self.assertIs(nav.island_dict["A"], self.a)
+        self.assertEqual(self.a, Island("A", 0, 0))
+        nav.simulate_day(50)
+        self.assertEqual(snapshot, copied.island_dict)
+
+    @number("2.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_island_table(self):
+        self.load_basic()
+        table = IslandTable.from_islands(self.islands)
+        expected = Mode2Navigator(4)
+        expected.add_islands(self.islands)
+        nav = Mode2Navigator(4)
+        nav.add_islands(table.to_islands())
+        self.assertEqual(nav.simulate_day(50), expected.simulate_day(50))
+        self.assertEqual(nav.snapshot(), expected.snapshot())
+        # the table is a copy, the plunders do not change it
+        self.assertEqual(table.to_islands(), self.islands)
+
+    @number("2.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_sharded_day(self):
+        RandomGen.set_seed(3)
+        islands = [
+            Island(f"I{i}", RandomGen.randint(1, 500), RandomGen.randint(1, 150))
+            for i in range(100)
+        ]
+        serial = Mode2Navigator(20)
+        serial.add_islands(islands)
+        sharded = Mode2Navigator(20)
+        sharded.add_islands(islands)
+        for crew, n_workers in [(60, 1), (60, 2), (25, 3)]:
+            self.assertEqual(sharded.simulate_day_sharded(crew, n_workers), serial.simulate_day(crew))
+            self.assertEqual(sharded.island_dict, serial.island_dict)
+        # the next serial day builds the score index again
+        self.assertIsNone(sharded.score_index)
+        self.assertEqual(sharded.simulate_day(25), serial.simulate_day(25))
+
+    @number("2.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_crew_changes(self):
+        RandomGen.set_seed(4)
+        islands = [
+            Island(f"I{i}", RandomGen.randint(1, 500), RandomGen.randint(1, 150))
+            for i in range(300)
+        ]
+        kept = Mode2Navigator(6, keep_index=True)
+        kept.add_islands(islands)
+        rebuilt = Mode2Navigator(6)
+        rebuilt.add_islands(islands)
+        for crew in [40, 90, 90, 10, 150, 1, 60]:
+            self.assertEqual(kept.simulate_day(crew), rebuilt.simulate_day(crew))
+            index = kept.score_index
+            self.assertEqual(len(index), len(kept.worth_names))
+            for k in range(1, len(index.looted_marines) + 1):
+                self.assertLessEqual(index.looted_marines.the_array[k].score, crew)
+            for k in range(1, len(index.partial_marines) + 1):
+                self.assertGreater(-index.partial_marines.the_array[k].score, crew)
+        self.assertEqual(kept.island_dict, rebuilt.island_dict)
+
+    @number("2.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_top_k_heap(self):
+        RandomGen.set_seed(5)
+        islands = [
+            Island(f"I{i}", RandomGen.randint(1, 500), RandomGen.randint(1, 150))
+            for i in range(300)
+        ]
+        full = Mode2Navigator(6)
+        full.TOP_K_RATIO = len(islands)
+        full.add_islands(islands)
+        top = Mode2Navigator(6)
+        top.add_islands(islands)
+        indexed = Mode2Navigator(6, keep_index=True)
+        indexed.add_islands(islands)
+        self.assertEqual(len(top.day_score_heap(40)), 6)
+        self.assertEqual(len(full.day_score_heap(40)), len(full.worth_names))
+        # the best islands run out after a few days, and the crew size changes
+        for crew in [40]*8 + [90]*4 + [20]*3:
+            expected = full.simulate_day(crew)
+            self.assertEqual(top.simulate_day(crew), expected)
+            self.assertEqual(indexed.simulate_day(crew), expected)
+        self.assertEqual(top.island_dict, full.island_dict)
+        self.assertEqual(indexed.island_dict, full.island_dict)
+        # nothing is kept between days without keep_index
+        self.assertIsNone(top.score_index)
+        self.assertIsNotNone(indexed.score_index)
+
+    @number("2.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_partial_runs(self):
+        # a run on A stops once it can be looted completely, its score then drops below B
+        for in_place in [False, True]:
+            nav = Mode2Navigator(10, in_place=in_place)
+            nav.add_islands([Island("A", 1000, 100), Island("B", 950, 100)])
+            results = nav.simulate_day(30)
+            expected = [(Island("A", 700, 70), 30), (Island("A", 400, 40), 30), (Island("A", 100, 10), 30),
+                        (Island("B", 665, 70), 30), (Island("B", 380, 40), 30), (Island("B", 95, 10), 30),
+                        (Island("A", 0, 0), 10), (Island("B", 0, 0), 10), (None, 0), (None, 0)]
+            if in_place:
+                expected = [(island.name if island is not None else None, sent_crew) for island, sent_crew in expected]
+            self.assertEqual(results, expected)
+            self.assertEqual(nav.snapshot(), {"A": Island("A", 0, 0), "B": Island("B", 0, 0)})